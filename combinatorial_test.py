@@ -1,17 +1,95 @@
 """Combinatorial testing script for the board game."""
 
+import functools
+import glob
+import hashlib
 import json
+import os
+import pickle
 import random
+import sys
+from array import array
 from collections import defaultdict
-from simulator.game import Game
+from simulator.pool import run_games
 
+# Card files parsed by load_game_data; their mtimes and sizes key the disk cache
+GAME_DATA_FILES = [
+    'actionCards/action_cards.json',
+    'greenCards/documents_work_cards.json',
+    'redCards/health_cards.json',
+    'redCards/housing_cards.json',
+    'whiteCards/random_events.json',
+    'itemCards/utility_items.json',
+    'itemCards/steal_effect_items.json',
+]
+# Bump when _parse_game_data changes what it returns, so older pickles are not reused
+GAME_DATA_FORMAT = 1
+# Top-level keys every parsed game_data holds; a cached copy without them is reparsed
+GAME_DATA_KEYS = ['game_constants', 'action_cards', 'green_cards', 'health_cards',
+                  'housing_cards', 'white_cards', 'personal_items']
+
+# Per-turn resources averaged into turn_by_turn_stats.json, in storage order
+TURN_RESOURCES = ['money', 'nerves', 'items', 'documents', 'language', 'goal_progress']
+MAX_TRACKED_TURNS = 121  # Game.run numbers turns 1..players * 15 (120 with 8 players)
+
+# Final-state resources summarized by GameStats.res_min/res_max/res_sum/res_count
+RESOURCE_NAMES = ['money', 'nerves', 'document_level', 'language_level']
+# Stand-in for a missing per-turn sample (e.g. no goal chosen yet); fits in array('d')
+NO_SAMPLE = float('nan')
+
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load game configuration."""
+    """Load game configuration (parsed once per process)."""
     with open('simulator/config.json', 'r', encoding='utf-8') as f:
         return json.load(f)
 
+def _game_data_cache_path():
+    """Path of the pickled game data for the current state of the card files."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"format:{GAME_DATA_FORMAT}\n".encode('utf-8'))
+    for path in sorted(GAME_DATA_FILES):
+        st = os.stat(path)
+        digest.update(f"{path}:{st.st_mtime_ns}:{st.st_size}\n".encode('utf-8'))
+    return os.path.join('stats', f'.gamedata.{digest.hexdigest()}.pkl')
+
+def _load_cached_game_data(cache_path):
+    """Pickled game data, or None if the cache is missing, unreadable or incomplete."""
+    try:
+        with open(cache_path, 'rb') as f:
+            game_data = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, ValueError):
+        return None  # Missing, truncated or foreign pickle: reparse and overwrite it
+    if not isinstance(game_data, dict) or any(key not in game_data for key in GAME_DATA_KEYS):
+        return None
+    return game_data
+
+@functools.lru_cache(maxsize=1)
 def load_game_data():
-    """Load all game data."""
+    """Load all game data, reusing the pickled copy while the card files are unchanged."""
+    cache_path = _game_data_cache_path()
+    game_data = _load_cached_game_data(cache_path)
+    if game_data is not None:
+        return game_data
+    
+    game_data = _parse_game_data()
+    
+    # Write to a temp file first so a concurrent run never reads a partial pickle
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(game_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    
+    # Caches of earlier card file versions can never be hit again
+    for stale_path in glob.glob(os.path.join('stats', '.gamedata.*.pkl')):
+        if stale_path != cache_path:
+            try:
+                os.remove(stale_path)
+            except FileNotFoundError:
+                pass  # Already removed by a concurrent run
+    return game_data
+
+def _parse_game_data():
+    """Parse all game data from the card JSON files."""
     game_data = {
         'game_constants': {
             'game_constants': {
@@ -25,7 +103,7 @@ def load_game_data():
     # Load action cards
     with open('actionCards/action_cards.json', 'r', encoding='utf-8') as f:
         action_cards = json.load(f)
-        game_data['action_cards'] = {'additional_action_cards': action_cards['action_cards']}
+        game_data['action_cards'] = {'action_cards': action_cards['action_cards']}
     
     # Load green cards
     with open('greenCards/documents_work_cards.json', 'r', encoding='utf-8') as f:
@@ -53,6 +131,22 @@ def load_game_data():
     
     return game_data
 
+def _turn_samples(turn_number, players, win_progress):
+    """Per-turn stat rows (profile, turn, TURN_RESOURCES values) for active players"""
+    samples = []
+    for player in players:
+        if player.is_eliminated:
+            continue
+        samples.append((player.profile, turn_number, (
+            player.money,
+            player.nerves,
+            len(player.personal_items_hand),
+            player.document_level,
+            player.language_level,
+            win_progress(player) if player.win_condition else NO_SAMPLE
+        )))
+    return samples
+
 class GameStats:
     def __init__(self):
         self.total_games = 0
@@ -61,218 +155,278 @@ class GameStats:
         self.wins_by_goal = defaultdict(int)
         self.eliminations = defaultdict(int)
         self.elimination_reasons = defaultdict(int)
-        self.resource_stats = defaultdict(lambda: {'min': float('inf'), 'max': float('-inf'), 'sum': 0, 'count': 0})
+        # Parallel per-resource columns, indexed like RESOURCE_NAMES
+        self.res_min = array('d', [float('inf')]) * len(RESOURCE_NAMES)
+        self.res_max = array('d', [float('-inf')]) * len(RESOURCE_NAMES)
+        self.res_sum = array('d', [0.0]) * len(RESOURCE_NAMES)
+        self.res_count = array('q', [0]) * len(RESOURCE_NAMES)
         self.goal_progress = defaultdict(lambda: {'min': float('inf'), 'max': float('-inf'), 'sum': 0, 'count': 0})
         self.incomplete_reasons = defaultdict(int)
-        self.turn_stats = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))  # char -> turn -> resource -> values
+        # char -> flat [turn][resource] arrays of running sums and sample counts
+        self.turn_sums = {}
+        self.turn_counts = {}
         
-    def track_turn(self, turn_number, players):
-        """Track resources for all players at given turn"""
-        for player in players:
-            if player.is_eliminated:
-                continue
-                
-            # Track basic resources
-            self.turn_stats[player.profile][turn_number]['money'].append(player.money)
-            self.turn_stats[player.profile][turn_number]['nerves'].append(player.nerves)
-            self.turn_stats[player.profile][turn_number]['items'].append(len(player.items) if hasattr(player, 'items') else 0)
-            self.turn_stats[player.profile][turn_number]['documents'].append(player.document_level)
-            self.turn_stats[player.profile][turn_number]['language'].append(player.language_level)
-            
-            # Track goal progress if exists
-            if player.win_condition:
-                self.turn_stats[player.profile][turn_number]['has_goal'] = True
-                if hasattr(player, 'goal_progress'):
-                    self.turn_stats[player.profile][turn_number]['goal_progress'].append(player.goal_progress)
-
-def run_combinatorial_test(num_games=1000):
-    """Run combinatorial testing of the game."""
-    config = load_config()
-    game_data = load_game_data()
-    stats = GameStats()
-    
-    print(f"Starting combinatorial testing with {num_games} games...")
+    def add_turn_sample(self, profile, turn_number, values):
+        """Add one value per TURN_RESOURCES entry (NO_SAMPLE = missing) for a character at a turn"""
+        if turn_number >= MAX_TRACKED_TURNS:
+            return
+        if profile not in self.turn_sums:
+            size = MAX_TRACKED_TURNS * len(TURN_RESOURCES)
+            self.turn_sums[profile] = array('d', [0.0]) * size
+            self.turn_counts[profile] = array('q', [0]) * size
+        sums, counts = self.turn_sums[profile], self.turn_counts[profile]
+        offset = turn_number * len(TURN_RESOURCES)
+        for value in values:
+            if value == value:  # NaN marks a missing sample
+                sums[offset] += value
+                counts[offset] += 1
+            offset += 1
     
-    for i in range(num_games):
-        if i % 100 == 0:
-            print(f"Running game {i+1}/{num_games}...")
+    def record_game(self, summary, elimination_threshold):
+        """Merge a per-game summary produced by _summarize_game"""
+        # Track state each turn; trace rows are [turn, *TURN_RESOURCES values]
+        width = len(TURN_RESOURCES) + 1
+        for profile, trace in summary['turn_trace'].items():
+            for start in range(0, len(trace), width):
+                self.add_turn_sample(profile, int(trace[start]), trace[start + 1:start + width])
+        self.total_games += 1
         
-        game = Game(config, game_data)
-        winner = game.run()
-        
-        # Track state each turn
-        current_turn = game.current_turn if hasattr(game, 'current_turn') else 0
-        for player in game.players:
-            if player.is_eliminated:
-                continue
-            
-            # Track resources for all active players
-            stats.turn_stats[player.profile][current_turn]['money'].append(player.money)
-            stats.turn_stats[player.profile][current_turn]['nerves'].append(player.nerves)
-            stats.turn_stats[player.profile][current_turn]['items'].append(len(player.items) if hasattr(player, 'items') else 0)
-            stats.turn_stats[player.profile][current_turn]['documents'].append(player.document_level)
-            stats.turn_stats[player.profile][current_turn]['language'].append(player.language_level)
-            
-            if player.win_condition:
-                stats.turn_stats[player.profile][current_turn]['goal'].append(player.win_condition['key'])
-                stats.turn_stats[player.profile][current_turn]['goal_progress'].append(game.calculate_win_progress(player))
-        stats.total_games += 1
-        
-        if winner:
-            stats.completed_games += 1
-            stats.wins_by_character[winner.profile] += 1
-            if winner.win_condition:
-                stats.wins_by_goal[winner.win_condition['key']] += 1
+        if summary['winner']:
+            self.completed_games += 1
+            self.wins_by_character[summary['winner']] += 1
+            if summary['win_condition']:
+                self.wins_by_goal[summary['win_condition']] += 1
         
         # Track eliminations
-        for player in game.players:
-            if player.is_eliminated:
-                stats.eliminations[player.profile] += 1
-                if player.nerves <= game_data['game_constants']['game_constants']['elimination_threshold']:
-                    stats.elimination_reasons['nerves'] += 1
-                elif player.money < 0:
-                    stats.elimination_reasons['money'] += 1
-            
-            # Track resource stats
-            for resource in ['money', 'nerves', 'document_level', 'language_level']:
-                value = float(getattr(player, resource))
-                resource_stats = stats.resource_stats[resource]
-                resource_stats['min'] = min(resource_stats['min'], value)
-                resource_stats['max'] = max(resource_stats['max'], value)
-                resource_stats['sum'] += value
-                resource_stats['count'] += 1
+        for player in summary['players']:
+            if player['is_eliminated']:
+                self.eliminations[player['profile']] += 1
+                if player['nerves'] <= elimination_threshold:
+                    self.elimination_reasons['nerves'] += 1
+                elif player['money'] < 0:
+                    self.elimination_reasons['money'] += 1
             
             # Track goal progress
-            if player.win_condition:
-                progress = game.calculate_win_progress(player)
-                goal_stats = stats.goal_progress[player.profile]
-                goal_stats['min'] = min(goal_stats['min'], progress)
-                goal_stats['max'] = max(goal_stats['max'], progress)
+            if player['goal']:
+                progress = player['progress']
+                goal_stats = self.goal_progress[player['profile']]
+                if progress < goal_stats['min']:
+                    goal_stats['min'] = progress
+                if progress > goal_stats['max']:
+                    goal_stats['max'] = progress
                 goal_stats['sum'] += progress
                 goal_stats['count'] += 1
         
+        # Track resource stats, reducing each resource column once per game
+        rows = [
+            (float(player['money']), float(player['nerves']),
+             float(player['document_level']), float(player['language_level']))
+            for player in summary['players']
+        ]
+        res_min, res_max = self.res_min, self.res_max
+        res_sum, res_count = self.res_sum, self.res_count
+        for i, column in enumerate(zip(*rows)):
+            low, high = min(column), max(column)
+            if low < res_min[i]:
+                res_min[i] = low
+            if high > res_max[i]:
+                res_max[i] = high
+            res_sum[i] += sum(column)
+            res_count[i] += len(column)
+        
         # Track incomplete reasons
-        if not winner:
-            if game.end_reason == 'time_limit':
-                stats.incomplete_reasons['time_limit'] += 1
-            elif game.end_reason == 'elimination':
-                stats.incomplete_reasons['all_eliminated'] += 1
-    
-    # Print results
-    print("\n=== TEST RESULTS ===")
-    print(f"\nTotal games: {stats.total_games}")
-    print(f"Completed games: {stats.completed_games} ({stats.completed_games/stats.total_games*100:.1f}%)")
-    
-    print("\nWins by character:")
-    total_wins = sum(stats.wins_by_character.values())
-    for char, wins in stats.wins_by_character.items():
-        print(f"  {char}: {wins} ({wins/stats.total_games*100:.1f}%)")
-    
-    print("\nWins by goal:")
-    for goal, wins in stats.wins_by_goal.items():
-        print(f"  {goal}: {wins} ({wins/stats.total_games*100:.1f}%)")
-    
-    print("\nEliminations:")
-    for char, count in stats.eliminations.items():
-        print(f"  {char}: {count} ({count/stats.total_games*100:.1f}%)")
-    
-    print("\nElimination reasons:")
+        if not summary['winner']:
+            if summary['end_reason'] == 'time_limit':
+                self.incomplete_reasons['time_limit'] += 1
+            elif summary['end_reason'] == 'elimination':
+                self.incomplete_reasons['all_eliminated'] += 1
+
+class _TurnTrace:
+    """on_turn_end hook that records one game's per-turn samples"""
+    
+    def __init__(self, game):
+        self.game = game
+        # profile -> flat array('d') of [turn, *TURN_RESOURCES values] rows; one
+        # contiguous buffer per character pickles far smaller than tuples of boxed numbers
+        self.rows = {}
+    
+    def __call__(self, turn_number, players):
+        for profile, turn, values in _turn_samples(turn_number, players, self.game.calculate_win_progress):
+            trace = self.rows.get(profile)
+            if trace is None:
+                trace = self.rows[profile] = array('d')
+            trace.append(turn)
+            trace.extend(values)
+
+def _summarize_game(game, turn_trace):
+    """Picklable summary of a finished game's final state and its turn trace."""
+    winner = game.winner
+    players = []
+    for player in game.players:
+        players.append({
+            'profile': player.profile,
+            'money': player.money,
+            'nerves': player.nerves,
+            'document_level': player.document_level,
+            'language_level': player.language_level,
+            'is_eliminated': player.is_eliminated,
+            'goal': player.win_condition['key'] if player.win_condition else None,
+            'progress': game.calculate_win_progress(player) if player.win_condition else 0.0
+        })
+    
+    return {
+        'winner': winner.profile if winner else None,
+        'win_condition': winner.win_condition['key'] if winner and winner.win_condition else None,
+        'end_reason': game.end_reason,
+        'players': players,
+        'turn_trace': turn_trace.rows
+    }
+
+def _share_lines(counts, total):
+    """Format a count-per-key mapping as one '  key: n (p%)' line per key (none if empty)."""
+    return [f"  {key}: {count} ({count/total*100:.1f}%)" for key, count in counts.items()]
+
+def run_combinatorial_test(num_games=1000, seed=None):
+    """Run combinatorial testing of the game.
+
+    With a seed, game i is played with seed + i, so runs are reproducible.
+    """
+    config = load_config()
+    game_data = load_game_data()
+    stats = GameStats()
+    elimination_threshold = game_data['game_constants']['game_constants']['elimination_threshold']
+    
+    print(f"Starting combinatorial testing with {num_games} games...")
+    
+    # Games are independent, so spread them over all cores; seeds come from
+    # the main process so forked workers don't share one random stream
+    if seed is not None:
+        seeds = range(seed, seed + num_games)
+    else:
+        seeds = [random.getrandbits(64) for _ in range(num_games)]
+    for i, summary in enumerate(run_games(config, game_data, seeds, _summarize_game, _TurnTrace)):
+        if i % 100 == 0:
+            print(f"Running game {i+1}/{num_games}...")
+        stats.record_game(summary, elimination_threshold)
+    
+    # Collect the report and write it once at the end instead of one
+    # blocking print per line
+    report = []
+    emit = report.append
+    emit("\n=== TEST RESULTS ===")
+    emit(f"\nTotal games: {stats.total_games}")
+    emit(f"Completed games: {stats.completed_games} ({stats.completed_games/stats.total_games*100:.1f}%)")
+    
+    emit("\nWins by character:")
+    report.extend(_share_lines(stats.wins_by_character, stats.total_games))
+    
+    emit("\nWins by goal:")
+    report.extend(_share_lines(stats.wins_by_goal, stats.total_games))
+    
+    emit("\nEliminations:")
+    report.extend(_share_lines(stats.eliminations, stats.total_games))
+    
+    emit("\nElimination reasons:")
     total_elims = sum(stats.elimination_reasons.values())
     if total_elims > 0:
-        for reason, count in stats.elimination_reasons.items():
-            print(f"  {reason}: {count} ({count/total_elims*100:.1f}%)")
-    
-    print("\nResource statistics:")
-    for resource, resource_stats in stats.resource_stats.items():
-        if resource_stats['count'] > 0:
-            avg = resource_stats['sum'] / resource_stats['count']
-            print(f"  {resource}:")
-            print(f"    Min: {resource_stats['min']:.1f}")
-            print(f"    Max: {resource_stats['max']:.1f}")
-            print(f"    Avg: {avg:.1f}")
-    
-    print("\nGoal progress:")
+        report.extend(_share_lines(stats.elimination_reasons, total_elims))
+    
+    emit("\nResource statistics:")
+    for i, resource in enumerate(RESOURCE_NAMES):
+        if stats.res_count[i] > 0:
+            avg = stats.res_sum[i] / stats.res_count[i]
+            emit(f"  {resource}:")
+            emit(f"    Min: {stats.res_min[i]:.1f}")
+            emit(f"    Max: {stats.res_max[i]:.1f}")
+            emit(f"    Avg: {avg:.1f}")
+    
+    emit("\nGoal progress:")
     for char, goal_stats in stats.goal_progress.items():
         if goal_stats['count'] > 0:
             avg = goal_stats['sum'] / goal_stats['count']
-            print(f"  {char}:")
-            print(f"    Min: {goal_stats['min']*100:.1f}%")
-            print(f"    Max: {goal_stats['max']*100:.1f}%")
-            print(f"    Avg: {avg*100:.1f}%")
+            emit(f"  {char}:")
+            emit(f"    Min: {goal_stats['min']*100:.1f}%")
+            emit(f"    Max: {goal_stats['max']*100:.1f}%")
+            emit(f"    Avg: {avg*100:.1f}%")
     
-    print("\nIncomplete game reasons:")
+    emit("\nIncomplete game reasons:")
     incomplete = stats.total_games - stats.completed_games
     if incomplete > 0:
-        for reason, count in stats.incomplete_reasons.items():
-            print(f"  {reason}: {count} ({count/incomplete*100:.1f}%)")
+        report.extend(_share_lines(stats.incomplete_reasons, incomplete))
     
     # Calculate and save turn-by-turn statistics
-    print("\nСохраняем статистику по ходам...")
+    emit("\nСохраняем статистику по ходам...")
     
     # Prepare data for JSON
     stats_by_turn = {
         'turns': {},
-        'characters': list(stats.turn_stats.keys())
+        'characters': list(stats.turn_sums.keys())
     }
     
-    # Calculate averages for each turn
-    for turn in range(0, 120):  # All turns
-        turn_data = {
-            'turn_number': turn,
-            'characters': {}
-        }
-        
-        for char in stats.turn_stats:
-            if not stats.turn_stats[char][turn]['money']:  # Skip if no data
+    # Divide every sum by its count in one pass per character, then slice
+    # the flat [turn][resource] averages into per-turn rows
+    width = len(TURN_RESOURCES)
+    goal_slot = TURN_RESOURCES.index('goal_progress')
+    averages = {
+        char: [total / count if count else None for total, count in zip(sums, stats.turn_counts[char])]
+        for char, sums in stats.turn_sums.items()
+    }
+    for turn in range(0, MAX_TRACKED_TURNS):  # All turns
+        characters = {}
+        for char, char_averages in averages.items():
+            row = char_averages[turn * width:(turn + 1) * width]
+            if row[0] is None:  # Skip if no data
                 continue
-                
-            char_data = {
-                'money': sum(stats.turn_stats[char][turn]['money']) / len(stats.turn_stats[char][turn]['money']),
-                'nerves': sum(stats.turn_stats[char][turn]['nerves']) / len(stats.turn_stats[char][turn]['nerves']),
-                'items': sum(stats.turn_stats[char][turn]['items']) / len(stats.turn_stats[char][turn]['items']),
-                'documents': sum(stats.turn_stats[char][turn]['documents']) / len(stats.turn_stats[char][turn]['documents']),
-                'language': sum(stats.turn_stats[char][turn]['language']) / len(stats.turn_stats[char][turn]['language'])
-            }
-            
+            char_data = dict(zip(TURN_RESOURCES[:goal_slot], row[:goal_slot]))
             # Add goal progress if available
-            if stats.turn_stats[char][turn].get('goal_progress'):
-                char_data['goal_progress'] = sum(stats.turn_stats[char][turn]['goal_progress']) / len(stats.turn_stats[char][turn]['goal_progress'])
-            
-            turn_data['characters'][char] = char_data
+            if row[goal_slot] is not None:
+                char_data['goal_progress'] = row[goal_slot]
+            characters[char] = char_data
         
-        if turn_data['characters']:  # Only save turns with data
-            stats_by_turn['turns'][str(turn)] = turn_data
+        if characters:  # Only save turns with data
+            stats_by_turn['turns'][str(turn)] = {'turn_number': turn, 'characters': characters}
     
     # Save to JSON file
-    with open('stats/turn_by_turn_stats.json', 'w', encoding='utf-8') as f:
-        json.dump(stats_by_turn, f, indent=2, ensure_ascii=False)
+    stats_path = 'stats/turn_by_turn_stats.json'
+    try:
+        with open(stats_path, 'w', encoding='utf-8') as f:
+            json.dump(stats_by_turn, f, indent=2, ensure_ascii=False)
+    except OSError:
+        # Don't lose the buffered report, and say which file could not be written
+        sys.stdout.write('\n'.join(report) + '\n')
+        sys.stdout.flush()
+        print(f"Не удалось сохранить статистику в {stats_path}", file=sys.stderr)
+        raise
     
-    print("Статистика сохранена в stats/turn_by_turn_stats.json")
+    emit(f"Статистика сохранена в {stats_path}")
     
     # Print balance metrics
-    print("\n=== BALANCE METRICS ===")
+    emit("\n=== BALANCE METRICS ===")
     
     # Character win rate spread
     if stats.wins_by_character:
         win_rates = [wins/stats.total_games*100 for wins in stats.wins_by_character.values()]
         win_rate_spread = max(win_rates) - min(win_rates)
-        print(f"\nCharacter win rate spread: {win_rate_spread:.1f}% (target: 5%)")
+        emit(f"\nCharacter win rate spread: {win_rate_spread:.1f}% (target: 5%)")
     
     # Goal win rate spread
     if stats.wins_by_goal:
         goal_rates = [wins/stats.total_games*100 for wins in stats.wins_by_goal.values()]
         goal_rate_spread = max(goal_rates) - min(goal_rates)
-        print(f"Goal win rate spread: {goal_rate_spread:.1f}% (target: 10%)")
+        emit(f"Goal win rate spread: {goal_rate_spread:.1f}% (target: 10%)")
     
     # Elimination rate
     total_players = stats.total_games * len(config['character_profiles'])
     total_eliminations = sum(stats.eliminations.values())
     elimination_rate = total_eliminations / total_players * 100
-    print(f"Elimination rate: {elimination_rate:.1f}% (target: 10-15%)")
+    emit(f"Elimination rate: {elimination_rate:.1f}% (target: 10-15%)")
     
     # Game completion rate
     completion_rate = stats.completed_games / stats.total_games * 100
-    print(f"Game completion rate: {completion_rate:.1f}% (target: 95%)")
+    emit(f"Game completion rate: {completion_rate:.1f}% (target: 95%)")
+    
+    sys.stdout.write('\n'.join(report) + '\n')
+    sys.stdout.flush()
     
     return stats
 
@@ -11,14 +11,18 @@ import random
 import json
 from pathlib import Path
 
+BASE_DIR = Path(__file__).resolve().parent
+CONFIG_PATH = BASE_DIR / "simulator" / "config.json"
+LOG_PATH = BASE_DIR / "detailed_game_log.json"
+
 # Добавляем путь к симулятору
-sys.path.append(str(Path(__file__).parent / "simulator"))
+sys.path.append(str(BASE_DIR / "simulator"))
 
 # Меняем рабочую директорию для корректной загрузки данных
-os.chdir(Path(__file__).parent)
+os.chdir(BASE_DIR)
 
-from core import Game
-from utils import load_game_data
+from simulator.game import Game
+from simulator.loader import load_game_data
 
 class DetailedGameAnalyzer:
     """Детальный анализатор игрового процесса"""
@@ -28,16 +32,42 @@ class DetailedGameAnalyzer:
         self.turn_details = []
         self.trade_history = []
         self.elimination_history = []
+        # Сколько записей лога уже выведено на экран
+        self._shown = 0
         
     def log(self, message, category="INFO"):
-        """Добавляет сообщение в лог"""
-        log_entry = {
-            "category": category,
-            "message": message,
-            "timestamp": len(self.log_entries)
-        }
-        self.log_entries.append(log_entry)
-        print(f"[{category}] {message}")
+        """Добавляет сообщение в лог и сразу печатает его"""
+        self.log_quiet(message, category)
+        self.flush_log()
+        
+    def log_quiet(self, template, category="INFO", *args):
+        """Добавляет сообщение в лог без вывода.
+        
+        Шаблон форматируется через str.format(*args) только при выводе
+        (flush_log) или сохранении (rendered_log).
+        """
+        self.log_entries.append((category, template, args))
+        
+    @staticmethod
+    def _format_entry(entry):
+        category, template, args = entry
+        return category, template.format(*args) if args else template
+        
+    def flush_log(self):
+        """Выводит ещё не показанные сообщения одной записью"""
+        pending = self.log_entries[self._shown:]
+        if pending:
+            sys.stdout.write(''.join(f"[{category}] {message}\n"
+                                     for category, message in map(self._format_entry, pending)))
+            sys.stdout.flush()
+            self._shown = len(self.log_entries)
+            
+    def rendered_log(self):
+        """Возвращает лог в виде списка словарей для сохранения"""
+        return [
+            {"category": category, "message": message, "timestamp": i}
+            for i, (category, message) in enumerate(map(self._format_entry, self.log_entries))
+        ]
         
     def analyze_player_state(self, player):
         """Анализирует состояние игрока"""
@@ -48,21 +78,21 @@ class DetailedGameAnalyzer:
             "язык": player.language_level,
             "жилье": f"{player.housing} (уровень {player.housing_level})",
             "документы": player.document_level,
-            "карт_документов": len(player.document_cards) if hasattr(player, 'document_cards') else 0,
-            "карт_действий": len(player.action_cards) if hasattr(player, 'action_cards') else 0,
+            "карт_документов": player.document_cards,
+            "карт_действий": len(player.action_cards),
             "позиция": player.position,
-            "цель": player.win_condition['key'],
-            "элиминирован": getattr(player, 'is_eliminated', False)
+            "цель": player.win_condition['key'] if player.win_condition else None,
+            "элиминирован": player.is_eliminated
         }
         return analysis
         
     def analyze_turn_decision(self, player, decision_type, details):
         """Анализирует решение игрока"""
-        self.log(f"🧠 РЕШЕНИЕ: {player.name} выбрал '{decision_type}' - {details}", "DECISION")
+        self.log_quiet("🧠 РЕШЕНИЕ: {} выбрал '{}' - {}", "DECISION", player.name, decision_type, details)
         
     def analyze_card_effect(self, player, card, effect_type):
         """Анализирует эффект карты"""
-        self.log(f"🎴 КАРТА: {player.name} использует '{card['name']}' как {effect_type}", "CARD")
+        self.log_quiet("🎴 КАРТА: {} использует '{}' как {}", "CARD", player.name, card['name'], effect_type)
         if 'effects' in card:
             effects = []
             for key, value in card['effects'].items():
@@ -72,37 +102,39 @@ class DetailedGameAnalyzer:
                     effects.append(f"{value} {key}")
                 else:
                     effects.append(f"{key}: {value}")
-            self.log(f"   ✨ Эффекты: {', '.join(effects)}", "EFFECT")
+            self.log_quiet("   ✨ Эффекты: {}", "EFFECT", ', '.join(effects))
             
     def analyze_goal_progress(self, player):
         """Анализирует прогресс к цели"""
         goal = player.win_condition
+        if not goal:
+            return
         current_state = self.analyze_player_state(player)
         
-        self.log(f"🎯 ПРОГРЕСС К ЦЕЛИ '{goal['key']}' для {player.name}:", "GOAL")
+        self.log_quiet("🎯 ПРОГРЕСС К ЦЕЛИ '{}' для {}:", "GOAL", goal['key'], player.name)
         
         if 'requires' in goal:
             for req, needed in goal['requires'].items():
                 if req == 'money':
                     current = current_state['деньги']
                     progress = min(100, (current / needed) * 100)
-                    self.log(f"   💰 Деньги: {current}/{needed} ({progress:.1f}%)", "PROGRESS")
+                    self.log_quiet("   💰 Деньги: {}/{} ({:.1f}%)", "PROGRESS", current, needed, progress)
                 elif req == 'document_level':
                     current = current_state['документы']
                     progress = min(100, (current / needed) * 100) if needed > 0 else 100
-                    self.log(f"   📋 Документы: {current}/{needed} ({progress:.1f}%)", "PROGRESS")
+                    self.log_quiet("   📋 Документы: {}/{} ({:.1f}%)", "PROGRESS", current, needed, progress)
                 elif req == 'language_level':
                     current = current_state['язык']
                     progress = min(100, (current / needed) * 100) if needed > 0 else 100
-                    self.log(f"   🗣️ Язык: {current}/{needed} ({progress:.1f}%)", "PROGRESS")
+                    self.log_quiet("   🗣️ Язык: {}/{} ({:.1f}%)", "PROGRESS", current, needed, progress)
                 elif req == 'nerves':
                     current = current_state['нервы']
                     progress = min(100, (current / needed) * 100) if needed > 0 else 100
-                    self.log(f"   😤 Нервы: {current}/{needed} ({progress:.1f}%)", "PROGRESS")
+                    self.log_quiet("   😤 Нервы: {}/{} ({:.1f}%)", "PROGRESS", current, needed, progress)
                 elif req == 'housing_type':
                     current = current_state['жилье']
                     status = "✅" if needed in current else "❌"
-                    self.log(f"   🏠 Жилье: {current} (нужно: {needed}) {status}", "PROGRESS")
+                    self.log_quiet("   🏠 Жилье: {} (нужно: {}) {}", "PROGRESS", current, needed, status)
                     
     def analyze_trade(self, initiator, partner, offered, requested, successful, was_honest=True):
         """Анализирует торговую сделку"""
@@ -145,8 +177,7 @@ class DetailedGameAnalyzer:
         
         # Загружаем данные
         try:
-            config_path = Path(__file__).parent / "simulator" / "config.json"
-            with open(config_path, 'r', encoding='utf-8') as f:
+            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
                 config = json.load(f)
             
             game_data = load_game_data()
@@ -166,7 +197,8 @@ class DetailedGameAnalyzer:
             for player in game.players:
                 state = self.analyze_player_state(player)
                 self.log(f"   👤 {state['имя']}: {state['деньги']}💰 {state['нервы']}😤 {state['язык']}🗣️ {state['жилье']}🏠", "SETUP")
-                self.log(f"      🎯 Цель: {player.win_condition['description']}", "SETUP")
+                if player.win_condition:
+                    self.log(f"      🎯 Цель: {player.win_condition['description']}", "SETUP")
                 
         except Exception as e:
             self.log(f"❌ Ошибка создания игры: {e}", "ERROR")
@@ -182,33 +214,29 @@ class DetailedGameAnalyzer:
             
             while not game.game_over and turn_count < max_turns:
                 turn_count += 1
-                self.log(f"\n🎲 ХОД {turn_count}", "TURN")
-                self.log("-" * 40, "TURN")
+                self.log_quiet("\n🎲 ХОД {}", "TURN", turn_count)
+                self.log_quiet("-" * 40, "TURN")
                 
                 # Сохраняем состояние до хода
-                turn_data = {
-                    "номер": turn_count,
-                    "состояние_до": {p.name: self.analyze_player_state(p) for p in game.players if not getattr(p, 'is_eliminated', False)}
-                }
+                active_players = [p for p in game.players if not p.is_eliminated]
+                state_before = {p.name: self.analyze_player_state(p) for p in active_players}
                 
-                # Выполняем ход
-                current_player = game.players[game.current_player_index]
-                if not getattr(current_player, 'is_eliminated', False):
-                    self.log(f"👤 Ход игрока: {current_player.name}", "TURN")
-                    
+                for current_player in active_players:
+                    self.log_quiet("👤 Ход игрока: {}", "TURN", current_player.name)
                     # Анализируем прогресс к цели перед ходом
                     self.analyze_goal_progress(current_player)
-                    
-                    # Выполняем ход (здесь нужно вызвать метод хода игры)
-                    # game.execute_turn(current_player)
-                    
-                    # Анализируем состояние после хода
-                    turn_data["состояние_после"] = {p.name: self.analyze_player_state(p) for p in game.players if not getattr(p, 'is_eliminated', False)}
-                    
-                self.turn_details.append(turn_data)
                 
-                # Переходим к следующему игроку
-                game.current_player_index = (game.current_player_index + 1) % len(game.players)
+                # Выполняем ход всех активных игроков
+                game.step()
+                
+                # Сохраняем ход, только если что-то изменилось
+                state_after = {p.name: self.analyze_player_state(p) for p in game.players if not p.is_eliminated}
+                if state_after != state_before:
+                    self.turn_details.append({
+                        "номер": turn_count,
+                        "состояние_до": state_before,
+                        "состояние_после": state_after
+                    })
                 
             # Результат игры
             if game.game_over:
@@ -229,9 +257,10 @@ class DetailedGameAnalyzer:
             
         # Генерируем отчет
         self.generate_final_report()
+        self.flush_log()
         
         return {
-            "логи": self.log_entries,
+            "логи": self.rendered_log(),
             "ходы": self.turn_details,
             "торговля": self.trade_history,
             "элиминации": self.elimination_history
@@ -270,7 +299,7 @@ def main():
     
     # Сохраняем результат в файл
     if result:
-        output_file = Path(__file__).parent / "detailed_game_log.json"
+        output_file = LOG_PATH
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(result, f, ensure_ascii=False, indent=2)
         print(f"\n📄 Детальный лог сохранен в: {output_file}")
@@ -4,22 +4,63 @@
 Интерактивная игра с AI противниками
 """
 
-import json
 import random
 import sys
 import os
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 
-# Добавляем путь к модулям симулятора
-sys.path.append(os.path.join(os.path.dirname(__file__), 'simulator'))
+from simulator.game import Game
+from simulator.entities.player import Player
+from simulator.entities.ai import AI
+from simulator.loader import load_game_data, load_json_file
 
-from core import Game, Player, AI, Deck, Board
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_FILE = os.path.join(BASE_DIR, 'simulator', 'config.json')
+
+
+def classify_global_event(card):
+    """Определяет по содержимому карты, является ли она глобальным событием"""
+    # Карты с conditions (условиями для групп игроков) - это события для всех
+    if 'character_id' in card.get('conditions', ()):
+        return True
+    
+    # Карты с типом instant И без cost - это события для всех
+    if card.get('type') == 'instant' and 'cost' not in card:
+        return True
+    
+    # ВСЕ остальные карты - это личные предметы (включая карты с cost, utility, interference и т.д.)
+    return False
+
+
+def annotate_cards(cards):
+    """Один раз при загрузке записывает в карты признаки, нужные при каждом розыгрыше"""
+    for card in cards:
+        effects = card.get('effects') or {}
+        card['_is_global_event'] = classify_global_event(card)
+        card['_when'] = card.get('when_to_play', 'anytime')
+        card['_is_interference'] = (card.get('type') == 'interference'
+                                    or card['_when'] == 'instant_response'
+                                    or any('block_' in str(key) for key in effects))
+        card['_is_defense'] = bool(effects.get('block_sabotage') or effects.get('reflect_sabotage'))
+        
+        # Готовые строки стоимости для всех мест, где карта выводится на экран
+        cost = card.get('cost', {})
+        card['_cost_raw'] = ', '.join(f"{amount} {resource}" for resource, amount in cost.items())
+        card['_cost_named'] = ', '.join(
+            "пропуск хода" if resource == 'skip_turn' else f"{amount} {resource}"
+            for resource, amount in cost.items()
+        )
+        card['_cost_emoji'] = ', '.join(
+            f"{cost[resource]} {icon}" for resource, icon in (('money', '💰'), ('nerves', '🧠')) if resource in cost
+        )
 
 
 class HumanPlayer:
     """Класс для человеческого игрока"""
     
+    __slots__ = ('player',)
+    
     def __init__(self, player: Player):
         self.player = player
         
@@ -112,10 +153,11 @@ class HumanPlayer:
             except ValueError:
                 print("❌ Введите число!")
     
-    def decide_play_action_card(self, when: str = 'start_of_turn') -> Optional[Dict]:
-        """Решение о разыгрывании карты действия"""
-        available_cards = [card for card in self.player.action_cards 
-                          if card.get('when_to_play', 'anytime') in ['anytime', when]]
+    def decide_play_action_card(self, when: str = 'start_of_turn') -> Optional[Tuple[int, Dict]]:
+        """Решение о разыгрывании карты действия: (индекс в руке, карта) или None"""
+        playable = [(hand_idx, card) for hand_idx, card in enumerate(self.player.action_cards)
+                    if card['_when'] in ('anytime', when)]
+        available_cards = [card for _, card in playable]
         
         if not available_cards:
             return None
@@ -124,12 +166,7 @@ class HumanPlayer:
         print("0. Не играть карту")
         
         for i, card in enumerate(available_cards, 1):
-            cost_str = ""
-            if 'cost' in card:
-                costs = []
-                for resource, amount in card['cost'].items():
-                    costs.append(f"{amount} {resource}")
-                cost_str = f" (стоит: {', '.join(costs)})"
+            cost_str = f" (стоит: {card['_cost_raw']})" if 'cost' in card else ""
             
             print(f"{i}. {card['name']}{cost_str}")
             print(f"   📝 {card['description']}")
@@ -140,7 +177,7 @@ class HumanPlayer:
                 if choice == 0:
                     return None
                 elif 1 <= choice <= len(available_cards):
-                    return available_cards[choice - 1]
+                    return playable[choice - 1]
                 else:
                     print("❌ Неверный номер!")
             except ValueError:
@@ -154,11 +191,7 @@ class HumanPlayer:
         # Найти подходящие карты для вмешательства
         suitable_cards = []
         for i, card in enumerate(self.player.action_cards):
-            if card.get('type') == 'interference':
-                suitable_cards.append((i, card))
-            elif card.get('when_to_play') == 'instant_response':
-                suitable_cards.append((i, card))
-            elif 'block_' in str(card.get('effects', {})):
+            if card['_is_interference']:
                 suitable_cards.append((i, card))
         
         if not suitable_cards:
@@ -169,15 +202,7 @@ class HumanPlayer:
         print(f"\n🃏 Ваши карты для вмешательства:")
         
         for i, (idx, card) in enumerate(suitable_cards, 1):
-            cost_text = ""
-            if 'cost' in card:
-                cost_parts = []
-                if 'money' in card['cost']:
-                    cost_parts.append(f"{card['cost']['money']} 💰")
-                if 'nerves' in card['cost']:
-                    cost_parts.append(f"{card['cost']['nerves']} 🧠")
-                if cost_parts:
-                    cost_text = f" (Стоимость: {', '.join(cost_parts)})"
+            cost_text = f" (Стоимость: {card['_cost_emoji']})" if card['_cost_emoji'] else ""
                     
             print(f"{i}. {card['name']}{cost_text}")
             print(f"   📝 {card['description']}")
@@ -212,8 +237,7 @@ class HumanPlayer:
         # Найти защитные карты
         defense_cards = []
         for i, card in enumerate(self.player.action_cards):
-            effects = card.get('effects', {})
-            if effects.get('block_sabotage') or effects.get('reflect_sabotage'):
+            if card['_is_defense']:
                 defense_cards.append((i, card))
         
         if not defense_cards:
@@ -224,15 +248,7 @@ class HumanPlayer:
         print(f"\n🃏 Ваши защитные карты:")
         
         for i, (idx, card) in enumerate(defense_cards, 1):
-            cost_text = ""
-            if 'cost' in card:
-                cost_parts = []
-                if 'money' in card['cost']:
-                    cost_parts.append(f"{card['cost']['money']} 💰")
-                if 'nerves' in card['cost']:
-                    cost_parts.append(f"{card['cost']['nerves']} 🧠")
-                if cost_parts:
-                    cost_text = f" (Стоимость: {', '.join(cost_parts)})"
+            cost_text = f" (Стоимость: {card['_cost_emoji']})" if card['_cost_emoji'] else ""
                     
             print(f"{i}. {card['name']}{cost_text}")
             print(f"   📝 {card['description']}")
@@ -266,49 +282,41 @@ class HumanPlayer:
 class InteractiveGame(Game):
     """Интерактивная версия игры"""
     
-    def __init__(self):
-        # Загружаем конфигурацию
-        config_path = os.path.join(os.path.dirname(__file__), 'simulator', 'config.json')
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        # Загружаем данные карт
-        base_path = os.path.dirname(__file__)
-        game_data = {}
-        
-        # Загружаем все типы карт и данные
-        card_files = {
-            'action_cards': 'actionCartds/action_cards.json',
-            'item_cards': 'itemCards/personal_items.json',
-            'green_cards': 'greenCards/documents_work_cards.json', 
-            'health_cards': 'redCards/health_cards.json',
-            'housing_cards': 'redCards/housing_cards.json',
-            'random_events': 'whiteCards/random_events.json',
-            'game_constants': 'Common/game_constants.json'
-        }
-        
-        for key, filename in card_files.items():
-            file_path = os.path.join(base_path, filename)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                game_data[key] = json.load(f)
-        
-        super().__init__(config, game_data)
+    def __init__(self, ai_delay=None, seed=None):
+        # Пауза (сек) перед ходом AI для удобства чтения; по умолчанию без пауз
+        if ai_delay is None:
+            ai_delay = float(os.environ.get('AI_DELAY', '0'))
+        self.ai_delay = ai_delay
+        
+        # BG_SEED делает партию воспроизводимой (кубики, колоды, решения AI)
+        if seed is None and os.environ.get('BG_SEED'):
+            seed = int(os.environ['BG_SEED'])
+        
+        # Загружаем конфигурацию и данные карт тем же загрузчиком, что и
+        # симулятор; колода предметов входит в таблицу колод Game, поэтому
+        # переживает reset()
+        config = load_json_file(CONFIG_FILE)
+        game_data = load_game_data()
+        
+        # Карты не меняются за игру, поэтому классифицируем их сразу
+        annotate_cards(game_data['action_cards']['action_cards'])
+        annotate_cards(game_data['personal_items']['personal_items'])
+        
+        super().__init__(config, game_data, seed=seed)
         self.human_player = None
-        
-        # Добавляем колоду предметов
-        from simulator.core import Deck
-        self.decks['item'] = Deck(game_data['item_cards']['personal_items'])
-        
-        # Переопределяем обработку карт действия в AI ходах
-        self._original_action_card_handler = None
+        # player -> (снимок состояния, результат _evaluate_goal) для повторных отрисовок
+        self._goal_cache = {}
         
     def setup_game(self):
         """Настройка игры"""
         print("🎮 ДОБРО ПОЖАЛОВАТЬ В ИГРУ 'ЖИЗНЬ В ИСПАНИИ'!")
         print("=" * 60)
         
-        # Очищаем список игроков, созданных родительским классом
-        self.players = []
+        # Очищаем список игроков, созданных родительским классом; менеджеры
+        # держат ссылку на этот же список. Колоды собираем заново, так как
+        # reset() уже раздал из них стартовые предметы
+        self.players.clear()
+        self.setup_decks()
         
         # Выбор количества AI противников
         while True:
@@ -322,14 +330,14 @@ class InteractiveGame(Game):
                 print("❌ Введите число!")
         
         # Выбор профиля для игрока
-        available_profiles = self.config['character_profiles'].copy()
+        available_profiles = self.character_profiles.copy()
         
         human_ai = HumanPlayer(None)
         player_profile = human_ai.choose_profile(available_profiles)
         available_profiles.remove(player_profile)
         
         # Создание игрока-человека
-        human_player_obj = Player(player_profile, None, self.config, self.game_data['game_constants'])
+        human_player_obj = Player(player_profile, None, self.config, self.game_data)
         human_player_obj.ai = AI(human_player_obj, self.config)
         human_player_obj.name = f"🧑 {player_profile['name']} (ВЫ)"
         self.human_player = HumanPlayer(human_player_obj)
@@ -339,7 +347,7 @@ class InteractiveGame(Game):
         # Создание AI игроков
         ai_profiles = random.sample(available_profiles, num_ai)
         for i, profile in enumerate(ai_profiles):
-            ai_player = Player(profile, None, self.config, self.game_data['game_constants'])
+            ai_player = Player(profile, None, self.config, self.game_data)
             ai_player.ai = AI(ai_player, self.config)
             ai_player.name = f"🤖 {profile['name']} (AI-{i+1})"
             self.players.append(ai_player)
@@ -347,6 +355,14 @@ class InteractiveGame(Game):
         # Раздаем каждому игроку по 3 предмета
         self.deal_starting_items()
         
+        # Дальнейшие карты действия AI проходят через проверку на глобальное событие
+        for ai_player in self.players[1:]:
+            ai_player.action_card_handler = self._handle_ai_drawn_action
+        
+        # Аналитика должна знать настоящий состав игроков
+        self.analytics.reset()
+        self.analytics.start_game(self.players)
+        
         print(f"\n👥 УЧАСТНИКИ ИГРЫ ({len(self.players)} игроков):")
         for player in self.players:
             print(f"   {player.name}")
@@ -383,127 +399,135 @@ class InteractiveGame(Game):
         # Используем новую панель статуса
         pass  # Панель уже отображается в новом методе
     
+    @staticmethod
+    def _emit(lines):
+        """Выводит готовый блок строк одной записью в stdout"""
+        sys.stdout.write('\n'.join(lines) + '\n')
+    
     def display_player_status_panel(self, player):
         """Подробная панель статуса для игрока-человека"""
-        print(f"\n{'🧑 ВАШ СТАТУС':^80}")
-        print("🔸" * 80)
-        
-        # Основные ресурсы в красивой таблице
-        print(f"┌─ 💰 ДЕНЬГИ: {player.money:>3} │ 🧠 НЕРВЫ: {player.nerves:>2} │ 📄 ДОКУМЕНТЫ: {player.document_cards} (уровень {player.document_level}) │ 🗣️ ЯЗЫК: {player.language_level} ─┐")
-        print(f"│ 🏠 ЖИЛЬЕ: {player.housing:<12} │ 📍 ПОЗИЦИЯ: {player.position:>2} │ 🎴 ПРЕДМЕТОВ: {len(player.action_cards):>2}                                │")
-        print("└─" + "─" * 76 + "─┘")
+        out = [
+            f"\n{'🧑 ВАШ СТАТУС':^80}",
+            "🔸" * 80,
+            # Основные ресурсы в красивой таблице
+            f"┌─ 💰 ДЕНЬГИ: {player.money:>3} │ 🧠 НЕРВЫ: {player.nerves:>2} │ 📄 ДОКУМЕНТЫ: {player.document_cards} (уровень {player.document_level}) │ 🗣️ ЯЗЫК: {player.language_level} ─┐",
+            f"│ 🏠 ЖИЛЬЕ: {player.housing:<12} │ 📍 ПОЗИЦИЯ: {player.position:>2} │ 🎴 ПРЕДМЕТОВ: {len(player.action_cards):>2}                                │",
+            "└─" + "─" * 76 + "─┘",
+        ]
         
         # Информация о цели и прогрессе
         if player.win_condition:
-            print(f"\n🎯 ВАША ЦЕЛЬ: {player.win_condition['description']}")
-            self.display_goal_progress(player)
+            out.append(f"\n🎯 ВАША ЦЕЛЬ: {player.win_condition['description']}")
+            out.append("   📊 ПРОГРЕСС К ЦЕЛИ:")
+            out.extend(self._evaluate_goal(player)[2])
         else:
-            print(f"\n🎯 ЦЕЛЬ: ❌ Не выбрана (нужен уровень документов 5)")
+            out.append(f"\n🎯 ЦЕЛЬ: ❌ Не выбрана (нужен уровень документов 5)")
             docs_needed = 5 - player.document_level
-            print(f"   📄 До выбора цели: {docs_needed} уровней документов")
+            out.append(f"   📄 До выбора цели: {docs_needed} уровней документов")
         
         # Предметы в руке
         if player.action_cards:
-            print(f"\n🎒 ПРЕДМЕТЫ В РУКЕ ({len(player.action_cards)}):")
+            out.append(f"\n🎒 ПРЕДМЕТЫ В РУКЕ ({len(player.action_cards)}):")
             for i, card in enumerate(player.action_cards, 1):
-                cost_info = ""
-                if 'cost' in card:
-                    costs = []
-                    for resource, amount in card['cost'].items():
-                        if resource == 'skip_turn':
-                            costs.append("пропуск хода")
-                        else:
-                            costs.append(f"{amount} {resource}")
-                    cost_info = f" (💰 {', '.join(costs)})"
-                print(f"   {i}. {card['name']}{cost_info}")
+                cost_info = f" (💰 {card['_cost_named']})" if 'cost' in card else ""
+                out.append(f"   {i}. {card['name']}{cost_info}")
         else:
-            print(f"\n🎒 ПРЕДМЕТЫ: Пусто")
+            out.append(f"\n🎒 ПРЕДМЕТЫ: Пусто")
+        
+        self._emit(out)
+    
+    # Числовые требования цели: ключ -> (подпись, атрибут игрока)
+    _NUMERIC_REQUIREMENTS = {
+        'document_level': ("📄 Документы", 'document_level'),
+        'language_level': ("🗣️ Язык", 'language_level'),
+        'money': ("💰 Деньги", 'money'),
+        'nerves': ("🧠 Нервы", 'nerves'),
+    }
+    
+    def _evaluate_goal(self, player):
+        """Один проход по требованиям цели: (выполнено, всего, строки для вывода)"""
+        # Результат зависит только от этих полей, поэтому между изменениями
+        # состояния повторные отрисовки берут его из кэша
+        snapshot = (player.housing, player.document_level, player.language_level,
+                    player.money, player.nerves, id(player.win_condition))
+        cached = self._goal_cache.get(player)
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+        
+        requirements = player.win_condition['requires']
+        completed_requirements = 0
+        lines = []
+        
+        for req_type, req_value in requirements.items():
+            if req_type == 'housing_type':
+                met = player.housing == req_value
+                lines.append(f"      🏠 Жилье: {'✅' if met else f'❌ нужно: {req_value}'}")
+            elif req_type in self._NUMERIC_REQUIREMENTS:
+                label, attr = self._NUMERIC_REQUIREMENTS[req_type]
+                current = getattr(player, attr)
+                met = current >= req_value
+                lines.append(f"      {label}: {'✅' if met else f'❌ {current}/{req_value}'}")
+            else:
+                continue
+            if met:
+                completed_requirements += 1
+        
+        result = (completed_requirements, len(requirements), lines)
+        self._goal_cache[player] = (snapshot, result)
+        return result
     
     def display_goal_progress(self, player):
         """Показывает прогресс к выполнению цели"""
         if not player.win_condition:
             return
         
-        requirements = player.win_condition['requires']
+        _, _, lines = self._evaluate_goal(player)
         print("   📊 ПРОГРЕСС К ЦЕЛИ:")
-        
-        for req_type, req_value in requirements.items():
-            if req_type == 'housing_type':
-                current = "✅" if player.housing == req_value else f"❌ нужно: {req_value}"
-                print(f"      🏠 Жилье: {current}")
-            elif req_type == 'document_level':
-                current = player.document_level
-                status = "✅" if current >= req_value else f"❌ {current}/{req_value}"
-                print(f"      📄 Документы: {status}")
-            elif req_type == 'language_level':
-                current = player.language_level
-                status = "✅" if current >= req_value else f"❌ {current}/{req_value}"
-                print(f"      🗣️ Язык: {status}")
-            elif req_type == 'money':
-                current = player.money
-                status = "✅" if current >= req_value else f"❌ {current}/{req_value}"
-                print(f"      💰 Деньги: {status}")
-            elif req_type == 'nerves':
-                current = player.nerves
-                status = "✅" if current >= req_value else f"❌ {current}/{req_value}"
-                print(f"      🧠 Нервы: {status}")
+        if lines:
+            print("\n".join(lines))
     
     def get_goal_completion_percentage(self, player):
         """Вычисляет процент выполнения цели"""
         if not player.win_condition:
             return 0.0
         
-        requirements = player.win_condition['requires']
-        completed_requirements = 0
-        total_requirements = len(requirements)
-        
-        for req_type, req_value in requirements.items():
-            if req_type == 'housing_type':
-                if player.housing == req_value:
-                    completed_requirements += 1
-            elif req_type == 'document_level':
-                if player.document_level >= req_value:
-                    completed_requirements += 1
-            elif req_type == 'language_level':
-                if player.language_level >= req_value:
-                    completed_requirements += 1
-            elif req_type == 'money':
-                if player.money >= req_value:
-                    completed_requirements += 1
-            elif req_type == 'nerves':
-                if player.nerves >= req_value:
-                    completed_requirements += 1
-        
+        completed_requirements, total_requirements, _ = self._evaluate_goal(player)
         return (completed_requirements / total_requirements) * 100
     
     def play_human_turn(self, player):
         """Обработка хода человека"""
-        print(f"\n{'🎯 ВАШ ХОД!':^80}")
-        print("🔹" * 80)
-        
-        # Показываем актуальный статус перед ходом
-        print(f"\n📊 ТЕКУЩИЙ СТАТУС:")
-        print(f"   💰 Деньги: {player.money} | 🧠 Нервы: {player.nerves} | 📄 Документы: L{player.document_level}({player.document_cards}) | 🗣️ Язык: {player.language_level}")
+        out = [
+            f"\n{'🎯 ВАШ ХОД!':^80}",
+            "🔹" * 80,
+            # Показываем актуальный статус перед ходом
+            f"\n📊 ТЕКУЩИЙ СТАТУС:",
+            f"   💰 Деньги: {player.money} | 🧠 Нервы: {player.nerves} | 📄 Документы: L{player.document_level}({player.document_cards}) | 🗣️ Язык: {player.language_level}",
+        ]
         
         if player.win_condition:
             completion = self.get_goal_completion_percentage(player)
-            print(f"   🎯 Прогресс к цели: {completion:.1f}% ({'🔥 БЛИЗКО К ПОБЕДЕ!' if completion >= 80 else '📈 В процессе'})")
+            out.append(f"   🎯 Прогресс к цели: {completion:.1f}% ({'🔥 БЛИЗКО К ПОБЕДЕ!' if completion >= 80 else '📈 В процессе'})")
         
         if player.action_cards:
-            print(f"   🎒 Предметов в руке: {len(player.action_cards)}")
-            print("   📝 Список предметов:")
+            out.append(f"   🎒 Предметов в руке: {len(player.action_cards)}")
+            out.append("   📝 Список предметов:")
             for i, card in enumerate(player.action_cards, 1):
-                when_play = card.get('when_to_play', 'anytime')
-                print(f"      {i}. {card['name']} (играть: {when_play})")
+                out.append(f"      {i}. {card['name']} (играть: {card['_when']})")
         
-        print()
+        out.append("")
+        self._emit(out)
         
         # 1. Выбор карты действия в начале хода
-        action_card = self.human_player.decide_play_action_card('start_of_turn')
-        if action_card:
+        decision = self.human_player.decide_play_action_card('start_of_turn')
+        if decision:
+            hand_idx, action_card = decision
             print(f"\n🎯 Играете карту: {action_card['name']}")
             self.apply_card_effect(player, action_card, 'event')
-            player.action_cards.remove(action_card)
+            # Эффект карты мог изменить руку - тогда ищем карту заново
+            if hand_idx < len(player.action_cards) and player.action_cards[hand_idx] is action_card:
+                player.action_cards.pop(hand_idx)
+            else:
+                player.action_cards.remove(action_card)
             self.decks['action'].discard(action_card)
         
         # 2. Бросок кубика и движение
@@ -515,6 +539,11 @@ class InteractiveGame(Game):
         player.position = (player.position + roll) % self.board.size
         print(f"📍 Переместились с {old_position} на {player.position}")
         
+        # Прошли старт - зарплата, аренда и документы, как у AI
+        if old_position > player.position:
+            print(f"\n💰 ВЫ ПРОШЛИ КРУГ! Зарплата, аренда и карта документов")
+            self.handle_lap_completion(player)
+        
         # 3. Фаза торговли (упрощена для интерактивной игры)
         print("\n💼 Фаза торговли пропущена в интерактивной версии")
         
@@ -542,13 +571,7 @@ class InteractiveGame(Game):
                     
                     # Показываем стоимость, если есть
                     if 'cost' in item_card:
-                        costs = []
-                        for resource, amount in item_card['cost'].items():
-                            if resource == 'skip_turn':
-                                costs.append("пропуск хода")
-                            else:
-                                costs.append(f"{amount} {resource}")
-                        print(f"💰 Стоимость: {', '.join(costs)}")
+                        print(f"💰 Стоимость: {item_card['_cost_named']}")
                     
                     # Показываем когда можно играть
                     when_to_play = item_card.get('when_to_play', 'anytime')
@@ -587,7 +610,17 @@ class InteractiveGame(Game):
         # 6. Проверка победы
         self.check_win_condition(player)
         if not self.game_over:
-            self.check_elimination(player)
+            self.elimination_manager.check_elimination(player, self.turn)
+    
+    def apply_card_effect(self, player, card, use_decision):
+        """Применяет карту механиками симулятора: обмен на документы, испытание или эффекты"""
+        if use_decision == 'exchange':
+            self.effect_manager.apply_effects(player, {'document_level': 1})
+            self.analytics.track_document_exchange(player, True, card)
+        elif 'challenge' in card:
+            self.challenge_manager.handle_challenge(print, player, card)
+        else:
+            self.effect_manager.apply_effects(player, card.get('effects', {}))
     
     def play_ai_turn(self, player):
         """Обработка хода AI (с выводом информации)"""
@@ -600,47 +633,40 @@ class InteractiveGame(Game):
         print(f"   🎯 Цель: {goal_text}")
         
         print("   ⏸️  AI делает ход...")
-        time.sleep(1)
-        
-        # Временно перехватываем обработку карт действия
-        original_add_action_card = player.add_action_card
-        
-        def custom_add_action_card(card):
-            """Перехватчик для обработки карт действия AI"""
-            # Определяем тип карты по содержимому
-            is_global_event = self.is_global_event_card(card)
-            
-            if is_global_event:
-                # Это событие для всех - даем возможность реагировать
-                print(f"📢 СОБЫТИЕ ДЛЯ ВСЕХ ИГРОКОВ: {card['name']}")
-                
-                # Применяем эффект ко всем игрокам с возможностью реакции
-                self.apply_global_event_with_reactions(card)
-                
-                self.decks['action'].discard(card)
-            
-            else:
-                # Это одноразовый предмет - добавляем в руку обычным способом
-                print(f"🎒 Одноразовый предмет для {player.name}")
-                original_add_action_card(card)
+        if self.ai_delay:
+            time.sleep(self.ai_delay)
         
-        player.add_action_card = custom_add_action_card
-        
-        try:
-            # Используем стандартную логику AI из родительского класса
-            super().take_turn(player)
-        finally:
-            # Восстанавливаем оригинальный метод
-            player.add_action_card = original_add_action_card
+        # Карты действия, которые AI тянет за ход, обрабатывает _handle_ai_drawn_action
+        super().take_turn(player)
         
         # Показываем результат хода
-        print(f"\n   📈 РЕЗУЛЬТАТ ХОДА:")
-        print(f"      💰 Деньги: {player.money} | 🧠 Нервы: {player.nerves} | 📄 Документы: L{player.document_level}({player.document_cards})")
+        out = [
+            f"\n   📈 РЕЗУЛЬТАТ ХОДА:",
+            f"      💰 Деньги: {player.money} | 🧠 Нервы: {player.nerves} | 📄 Документы: L{player.document_level}({player.document_cards})",
+        ]
         if player.win_condition:
-            print(f"      🎯 Прогресс к цели: {self.get_goal_completion_percentage(player):.1f}%")
+            out.append(f"      🎯 Прогресс к цели: {self.get_goal_completion_percentage(player):.1f}%")
+        out.append("   ✅ Ход завершен")
+        self._emit(out)
+        if self.ai_delay:
+            time.sleep(self.ai_delay / 2)
+    
+    def _handle_ai_drawn_action(self, player, card):
+        """Перехватчик карт действия AI: глобальные события разыгрываются сразу"""
+        # Определяем тип карты по содержимому
+        if self.is_global_event_card(card):
+            # Это событие для всех - даем возможность реагировать
+            print(f"📢 СОБЫТИЕ ДЛЯ ВСЕХ ИГРОКОВ: {card['name']}")
+            
+            # Применяем эффект ко всем игрокам с возможностью реакции
+            self.apply_global_event_with_reactions(card)
+            
+            self.decks['action'].discard(card)
+            return True
         
-        print("   ✅ Ход завершен")
-        time.sleep(0.5)
+        # Это одноразовый предмет - добавляем в руку обычным способом
+        print(f"🎒 Одноразовый предмет для {player.name}")
+        return False
     
     def handle_action_card_draw_human(self, player, action_card):
         """Обработка получения карты действия для человека"""
@@ -666,10 +692,7 @@ class InteractiveGame(Game):
             
             # Показываем стоимость, если есть
             if 'cost' in action_card:
-                costs = []
-                for resource, amount in action_card['cost'].items():
-                    costs.append(f"{amount} {resource}")
-                print(f"💰 Стоимость: {', '.join(costs)}")
+                print(f"💰 Стоимость: {action_card['_cost_raw']}")
             
             # Показываем когда можно играть
             when_to_play = action_card.get('when_to_play', 'anytime')
@@ -685,16 +708,10 @@ class InteractiveGame(Game):
 
     def is_global_event_card(self, card):
         """Определяет, является ли карта глобальным событием"""
-        # Карты с conditions (условиями для групп игроков) - это события для всех
-        if 'conditions' in card and 'character_id' in card.get('conditions', {}):
-            return True
-        
-        # Карты с типом instant И без cost - это события для всех
-        if card.get('type') == 'instant' and 'cost' not in card:
-            return True
-        
-        # ВСЕ остальные карты - это личные предметы (включая карты с cost, utility, interference и т.д.)
-        return False
+        is_global_event = card.get('_is_global_event')
+        if is_global_event is None:  # Карта не прошла annotate_cards
+            return classify_global_event(card)
+        return is_global_event
 
     def apply_global_event_with_reactions(self, event_card):
         """Применяет событие для всех с возможностью реакций"""
@@ -787,32 +804,10 @@ class InteractiveGame(Game):
         """Основной цикл игры"""
         self.setup_game()
         
-        max_turns = len(self.players) * 15
-        lap_frequency = max(4, min(6, self.board.size // (len(self.players) * 2)))
-        
-        while self.turn < max_turns and not self.game_over:
-            # Отображение состояния
+        # step() ведет счет ходов, лимит и выбывания; ходы идут через take_turn
+        while not self.game_over:
             self.display_game_state()
-            
-            # Обработка круга (выплата зарплаты)
-            if self.turn > 0 and self.turn % lap_frequency == 0:
-                print(f"\n💰 КОНЕЦ КРУГА! Все получают зарплату и документы!")
-                self.handle_lap_completion()
-            
-            # Ход каждого игрока
-            for player in self.players:
-                if self.game_over:
-                    break
-                
-                if player.is_eliminated:
-                    continue
-                
-                self.take_turn(player)
-                
-                if self.game_over:
-                    break
-            
-            self.turn += 1
+            self.step()
         
         # Результаты игры
         self.display_results()
@@ -829,7 +824,10 @@ class InteractiveGame(Game):
             else:
                 print(f"\n🤖 Победил AI: {self.winner.name}")
             
-            print(f"🎯 Цель: {self.winner.win_condition['description']}")
+            if self.winner.win_condition:
+                print(f"🎯 Цель: {self.winner.win_condition['description']}")
+            else:
+                print("🛡️ Остался единственным игроком в игре")
         else:
             print(f"\n⏰ Игра завершена по времени (лимит {self.turn} ходов)")
         
@@ -854,7 +852,8 @@ class InteractiveGame(Game):
 def main():
     """Главная функция"""
     try:
-        game = InteractiveGame()
+        # --slow возвращает прежние паузы между ходами AI
+        game = InteractiveGame(ai_delay=1.0 if '--slow' in sys.argv[1:] else None)
         game.run()
     except KeyboardInterrupt:
         print("\n\n👋 До свидания!")
@@ -8,10 +8,22 @@ Runs multiple games with detailed tracking and analysis
 import json
 import time
 import os
+import random
+from contextlib import closing
 from typing import Dict, List
-from simulator.game import Game
 from simulator.analytics import MultiGameAnalytics
 from simulator.loader import load_game_data
+from simulator.pool import run_games
+
+
+def _summarize_game(game):
+    """Basic result and analytics report of a finished game"""
+    result = {
+        'winner': game.winner.name if game.winner else None,
+        'end_reason': game.end_reason,
+        'turns': game.turn,
+    }
+    return result, game.analytics.generate_report()
 
 
 class AdvancedGameRunner:
@@ -44,6 +56,10 @@ class AdvancedGameRunner:
             'summary': {},
             'detailed_analytics': {}
         }
+        
+        # Append-only log of per-game results, one JSON object per line
+        self.games_log_path = os.path.join(
+            os.path.dirname(__file__), 'output', f"simulation_games_{int(time.time())}.ndjson")
     
     def run_simulation_batch(self, num_games: int, batch_size: int = 100, 
                            save_interval: int = 250) -> Dict:
@@ -54,55 +70,63 @@ class AdvancedGameRunner:
         start_time = time.time()
         completed_games = 0
         
-        for batch_start in range(0, num_games, batch_size):
-            batch_end = min(batch_start + batch_size, num_games)
-            batch_games = batch_end - batch_start
-            
-            print(f"\n🎮 Running batch {batch_start//batch_size + 1}: "
-                  f"games {batch_start + 1}-{batch_end}")
-            
-            batch_start_time = time.time()
-            
-            for game_num in range(batch_start, batch_end):
-                try:
-                    # Run single game
-                    game = Game(self.config, self.game_data)
-                    game.run()  # Reasonable limit
-                    
-                    # Collect analytics
-                    self.multi_analytics.add_game(game.analytics)
-                    
-                    # Store basic result
-                    self.results['games'].append({
-                        'game_id': game_num + 1,
-                        'winner': game.winner.name if game.winner else None,
-                        'end_reason': game.end_reason,
-                        'turns': game.turn,
-                        'duration': time.time() - batch_start_time
-                    })
-                    
-                    completed_games += 1
+        # Games are independent, so they run across all cores. Seeds are chosen
+        # here so forked workers don't share one random stream
+        seeds = [random.getrandbits(64) for _ in range(num_games)]
+        outcomes = run_games(self.config, self.game_data, seeds, _summarize_game)
+        
+        os.makedirs(os.path.dirname(self.games_log_path), exist_ok=True)
+        games_log = open(self.games_log_path, 'a', encoding='utf-8', buffering=1)
+        
+        with closing(outcomes), games_log:
+            for batch_start in range(0, num_games, batch_size):
+                batch_end = min(batch_start + batch_size, num_games)
+                batch_games = batch_end - batch_start
+                
+                print(f"\n🎮 Running batch {batch_start//batch_size + 1}: "
+                      f"games {batch_start + 1}-{batch_end}")
+                
+                batch_start_time = time.time()
+                
+                for game_num in range(batch_start, batch_end):
+                    try:
+                        # Next finished game, in submission order
+                        result, report = next(outcomes)
+                        
+                        # Collect analytics
+                        self.multi_analytics.add_report(report)
+                        
+                        # Store basic result
+                        record = {
+                            'game_id': game_num + 1,
+                            **result,
+                            # Playing time measured in the worker, not time since batch start
+                            'duration': report['game_metadata']['duration_seconds']
+                        }
+                        self.results['games'].append(record)
+                        games_log.write(json.dumps(record, ensure_ascii=False) + '\n')
+                        
+                        completed_games += 1
+                        
+                        # Progress indicator
+                        if (game_num + 1) % 50 == 0:
+                            progress = ((game_num + 1) / num_games) * 100
+                            elapsed = time.time() - start_time
+                            eta = (elapsed / (game_num + 1)) * (num_games - game_num - 1)
+                            print(f"  Progress: {progress:.1f}% ({game_num + 1}/{num_games}) "
+                                  f"ETA: {eta/60:.1f}min")
                     
-                    # Progress indicator
-                    if (game_num + 1) % 50 == 0:
-                        progress = ((game_num + 1) / num_games) * 100
-                        elapsed = time.time() - start_time
-                        eta = (elapsed / (game_num + 1)) * (num_games - game_num - 1)
-                        print(f"  Progress: {progress:.1f}% ({game_num + 1}/{num_games}) "
-                              f"ETA: {eta/60:.1f}min")
+                    except Exception as e:
+                        print(f"❌ Error in game {game_num + 1}: {e}")
+                        raise e
                 
-                except Exception as e:
-                    print(f"❌ Error in game {game_num + 1}: {e}")
-                    raise e
-                    continue
-            
-            batch_time = time.time() - batch_start_time
-            print(f"  ✅ Batch completed in {batch_time:.1f}s "
-                  f"({batch_games/batch_time:.1f} games/sec)")
-            
-            # Save intermediate results
-            if completed_games % save_interval == 0 or batch_end >= num_games:
-                self._save_intermediate_results(completed_games)
+                batch_time = time.time() - batch_start_time
+                print(f"  ✅ Batch completed in {batch_time:.1f}s "
+                      f"({batch_games/batch_time:.1f} games/sec)")
+                
+                # Save intermediate results
+                if completed_games % save_interval == 0 or batch_end >= num_games:
+                    self._save_intermediate_results(completed_games)
         
         # Generate final report
         total_time = time.time() - start_time
@@ -129,15 +153,19 @@ class AdvancedGameRunner:
         # Generate current summary
         current_summary = self.multi_analytics.generate_summary_report()
         
+        # Per-game records are already streamed to the games log
         progress_data = {
             'completed_games': completed_games,
             'timestamp': timestamp,
             'summary': current_summary,
-            'recent_games': self.results['games'][-100:]  # Last 100 games
+            'games_log': os.path.basename(self.games_log_path)
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
+        # Write to a temp file first so a crash never leaves a partial snapshot
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(progress_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, filepath)
         
         print(f"  💾 Progress saved: {filename}")
     
@@ -149,18 +177,35 @@ class AdvancedGameRunner:
         games = self.results['games']
         summary = self.results['summary']
         
+        # Count everything the performance metrics need in a single pass
+        wins = timeouts = eliminations = total_turns = 0
+        for g in games:
+            if g['winner']:
+                wins += 1
+            end_reason = g['end_reason']
+            if end_reason == 'time_limit':
+                timeouts += 1
+            elif 'elimination' in end_reason:
+                eliminations += 1
+            total_turns += g['turns']
+        
+        # Computed once here and handed to the recommendations as well
+        balance = self._analyze_balance()
+        card_effectiveness = self._analyze_card_effectiveness()
+        profile_performance = self._analyze_profile_performance()
+        
         analysis = {
             'performance_metrics': {
-                'completion_rate': len([g for g in games if g['winner']]) / len(games),
-                'average_game_length': sum(g['turns'] for g in games) / len(games),
-                'timeout_rate': len([g for g in games if g['end_reason'] == 'timeout']) / len(games),
-                'elimination_rate': len([g for g in games if 'elimination' in g['end_reason']]) / len(games)
+                'completion_rate': wins / len(games),
+                'average_game_length': total_turns / len(games),
+                'timeout_rate': timeouts / len(games),
+                'elimination_rate': eliminations / len(games)
             },
-            'balance_analysis': self._analyze_balance(),
-            'card_effectiveness': self._analyze_card_effectiveness(),
+            'balance_analysis': balance,
+            'card_effectiveness': card_effectiveness,
             'mechanic_usage': self._analyze_mechanic_usage(),
-            'player_profile_performance': self._analyze_profile_performance(),
-            'recommendations': self._generate_recommendations()
+            'player_profile_performance': profile_performance,
+            'recommendations': self._generate_recommendations(balance, card_effectiveness, profile_performance)
         }
         
         return analysis
@@ -174,22 +219,31 @@ class AdvancedGameRunner:
         
         balance = summary['balance_analysis']
         
+        # Pull out the leaves used below once instead of re-walking the nesting
+        avg_turns = balance.get('game_length_stats', {}).get('avg_turns', 0)
+        win_balance = balance.get('win_balance', {})
+        win_distribution = win_balance.get('win_distribution', {})
+        success_rates = balance.get('success_rates', {})
+        challenge_success_rate = success_rates.get('avg_challenge_success_rate', 0)
+        length_ok = 50 <= avg_turns <= 120
+        variety_ok = len(win_distribution) >= 3
+        
         return {
             'game_length_balance': {
-                'status': 'good' if 50 <= balance.get('game_length_stats', {}).get('avg_turns', 0) <= 120 else 'needs_adjustment',
-                'avg_turns': balance.get('game_length_stats', {}).get('avg_turns', 0),
-                'recommendation': 'Optimal length' if 50 <= balance.get('game_length_stats', {}).get('avg_turns', 0) <= 120 else 'Consider adjusting game pace'
+                'status': 'good' if length_ok else 'needs_adjustment',
+                'avg_turns': avg_turns,
+                'recommendation': 'Optimal length' if length_ok else 'Consider adjusting game pace'
             },
             'win_distribution': {
-                'status': 'good' if len(balance.get('win_balance', {}).get('win_distribution', {})) >= 3 else 'unbalanced',
-                'unique_winners': balance.get('win_balance', {}).get('unique_winners', 0),
-                'recommendation': 'Good variety' if len(balance.get('win_balance', {}).get('win_distribution', {})) >= 3 else 'Some profiles dominate'
+                'status': 'good' if variety_ok else 'unbalanced',
+                'unique_winners': win_balance.get('unique_winners', 0),
+                'recommendation': 'Good variety' if variety_ok else 'Some profiles dominate'
             },
-            'success_rates': balance.get('success_rates', {}),
+            'success_rates': success_rates,
             'challenge_difficulty': {
-                'document_success_rate': balance.get('success_rates', {}).get('avg_document_success_rate', 0),
-                'challenge_success_rate': balance.get('success_rates', {}).get('avg_challenge_success_rate', 0),
-                'status': 'balanced' if 0.4 <= balance.get('success_rates', {}).get('avg_challenge_success_rate', 0) <= 0.7 else 'needs_adjustment'
+                'document_success_rate': success_rates.get('avg_document_success_rate', 0),
+                'challenge_success_rate': challenge_success_rate,
+                'status': 'balanced' if 0.4 <= challenge_success_rate <= 0.7 else 'needs_adjustment'
             }
         }
     
@@ -201,13 +255,14 @@ class AdvancedGameRunner:
             return {}
         
         card_usage = summary['card_usage_summary']
+        total_cards_played = card_usage.get('total_cards_played', 0)
         
         return {
             'most_used_cards': card_usage.get('most_used_cards_overall', [])[:10],
             'underused_cards': card_usage.get('unused_cards', {}),
             'card_type_balance': card_usage.get('cards_by_type', {}),
-            'total_cards_played': card_usage.get('total_cards_played', 0),
-            'cards_per_game': card_usage.get('total_cards_played', 0) / len(self.results['games']) if self.results['games'] else 0
+            'total_cards_played': total_cards_played,
+            'cards_per_game': total_cards_played / len(self.results['games']) if self.results['games'] else 0
         }
     
     def _analyze_mechanic_usage(self) -> Dict:
@@ -253,13 +308,17 @@ class AdvancedGameRunner:
         
         return profile_performance
     
-    def _generate_recommendations(self) -> List[str]:
-        """Generate recommendations based on analysis"""
+    def _generate_recommendations(self, balance: Dict = None, card_effectiveness: Dict = None,
+                                  profile_performance: Dict = None) -> List[str]:
+        """Generate recommendations based on analysis; missing analyses are computed here"""
         recommendations = []
         
-        balance = self._analyze_balance()
-        card_effectiveness = self._analyze_card_effectiveness()
-        profile_performance = self._analyze_profile_performance()
+        if balance is None:
+            balance = self._analyze_balance()
+        if card_effectiveness is None:
+            card_effectiveness = self._analyze_card_effectiveness()
+        if profile_performance is None:
+            profile_performance = self._analyze_profile_performance()
         
         # Game length recommendations
         if balance.get('game_length_balance', {}).get('status') == 'needs_adjustment':
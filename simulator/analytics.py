@@ -7,9 +7,39 @@ Tracks all game mechanics, card usage, and game flow
 
 import json
 import time
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, Counter
 from typing import Dict, List, Any, Optional
 
+# Number of most recent turns included in a game report
+TURN_EVENTS_SAMPLE_SIZE = 10
+
+# Keys under which card data files keep their card lists
+CARD_LIST_KEYS = ('action_cards', 'personal_items', 'health_cards', 'housing_cards')
+
+
+def _new_flow_counter() -> Dict:
+    """Running totals for a stream of resource amounts"""
+    return {'count': 0, 'total': 0, 'min': None, 'max': None}
+
+
+def _add_to_flow_counter(counter: Dict, amount: int):
+    """Fold one amount into a counter from _new_flow_counter()"""
+    counter['count'] += 1
+    counter['total'] += amount
+    if counter['min'] is None or amount < counter['min']:
+        counter['min'] = amount
+    if counter['max'] is None or amount > counter['max']:
+        counter['max'] = amount
+
+
+def _merge_flow_counters(target: Dict, source: Dict):
+    """Merge counter source into target in place"""
+    target['count'] += source['count']
+    target['total'] += source['total']
+    for key, pick in (('min', min), ('max', max)):
+        if source[key] is not None:
+            target[key] = source[key] if target[key] is None else pick(target[key], source[key])
+
 
 class GameAnalytics:
     """Comprehensive analytics system for tracking all game mechanics"""
@@ -48,8 +78,9 @@ class GameAnalytics:
             'dice_challenges': {'total': 0, 'health': 0, 'housing': 0, 'language': 0, 'documents': 0, 'successes': 0},
             'housing_upgrades': {'room_to_apartment': 0, 'apartment_to_mortgage': 0},
             'language_upgrades': {'basic_to_b1': 0, 'b1_to_c1': 0},
-            'money_transactions': {'gains': [], 'losses': []},
-            'nerve_changes': {'gains': [], 'losses': []},
+            # Running totals instead of every single amount
+            'money_transactions': {'gains': _new_flow_counter(), 'losses': _new_flow_counter()},
+            'nerve_changes': {'gains': _new_flow_counter(), 'losses': _new_flow_counter()},
             'interactions': {'interferences': 0, 'defenses': 0, 'blocks': 0},
             'effect_thefts': {
                 'total_thefts': 0,
@@ -61,8 +92,11 @@ class GameAnalytics:
             'bonuses_used': defaultdict(int)
         }
         
-        # Game flow tracking
-        self.turn_events = []
+        # Game flow tracking; only the most recent turns make it into the
+        # report, so older turns are dropped instead of kept for the whole game
+        self.turn_events = deque(maxlen=TURN_EVENTS_SAMPLE_SIZE)
+        # Events list of the turn in progress, None before the first turn
+        self._current_events = None
         self.cell_visits = defaultdict(int)
         self.goal_progress = {}
         
@@ -131,6 +165,7 @@ class GameAnalytics:
             'events': []
         }
         self.turn_events.append(turn_data)
+        self._current_events = turn_data['events']
     
     def track_cell_visit(self, player: Any, cell_position: int, cell_type: str):
         """Track when a player visits a cell"""
@@ -169,8 +204,9 @@ class GameAnalytics:
         self.players_data[player.name]['challenges_faced'][challenge_type] += 1
         
         # Add to current turn events
-        if self.turn_events:
-            self.turn_events[-1]['events'].append({
+        events = self._current_events
+        if events is not None:
+            events.append({
                 'type': 'dice_challenge',
                 'challenge_type': challenge_type,
                 'card': card.get('name', 'unknown'),
@@ -191,8 +227,9 @@ class GameAnalytics:
             self.track_card_played(card_used, 'action_cards', acting_player)
         
         # Add to turn events
-        if self.turn_events:
-            self.turn_events[-1]['events'].append({
+        events = self._current_events
+        if events is not None:
+            events.append({
                 'type': 'interaction',
                 'interaction_type': interaction_type,
                 'acting_player': acting_player.name,
@@ -206,18 +243,19 @@ class GameAnalytics:
         """Track resource changes (money, nerves)"""
         if resource_type == 'money':
             if amount > 0:
-                self.mechanics_stats['money_transactions']['gains'].append(amount)
+                _add_to_flow_counter(self.mechanics_stats['money_transactions']['gains'], amount)
             else:
-                self.mechanics_stats['money_transactions']['losses'].append(abs(amount))
+                _add_to_flow_counter(self.mechanics_stats['money_transactions']['losses'], abs(amount))
         elif resource_type == 'nerves':
             if amount > 0:
-                self.mechanics_stats['nerve_changes']['gains'].append(amount)
+                _add_to_flow_counter(self.mechanics_stats['nerve_changes']['gains'], amount)
             else:
-                self.mechanics_stats['nerve_changes']['losses'].append(abs(amount))
+                _add_to_flow_counter(self.mechanics_stats['nerve_changes']['losses'], abs(amount))
         
         # Add to turn events
-        if self.turn_events:
-            self.turn_events[-1]['events'].append({
+        events = self._current_events
+        if events is not None:
+            events.append({
                 'type': 'resource_change',
                 'player': player.name,
                 'resource': resource_type,
@@ -276,28 +314,20 @@ class GameAnalytics:
         unused_cards = {}
         
         for card_type, cards_dict in all_cards_data.items():
-            if card_type in self.card_usage:
-                used_card_ids = set(self.card_usage[card_type].keys())
-                
-                # Get all card IDs from the data
-                if isinstance(cards_dict, dict):
-                    # Handle different data structures
-                    if 'action_cards' in cards_dict:
-                        all_card_ids = {card['id'] for card in cards_dict['action_cards']}
-                    elif 'personal_items' in cards_dict:
-                        all_card_ids = {card['id'] for card in cards_dict['personal_items']}
-                    elif 'health_cards' in cards_dict:
-                        all_card_ids = {card['id'] for card in cards_dict['health_cards']}
-                    elif 'housing_cards' in cards_dict:
-                        all_card_ids = {card['id'] for card in cards_dict['housing_cards']}
-                    else:
-                        all_card_ids = {card['id'] for card in cards_dict if isinstance(card, dict)}
-                else:
-                    all_card_ids = {card['id'] for card in cards_dict if isinstance(card, dict)}
-                
-                unused_card_ids = all_card_ids - used_card_ids
-                if unused_card_ids:
-                    unused_cards[card_type] = list(unused_card_ids)
+            if card_type not in self.card_usage:
+                continue
+            
+            # Card files either are a plain list or wrap the list under a known key
+            if isinstance(cards_dict, dict):
+                list_key = next((key for key in CARD_LIST_KEYS if key in cards_dict), None)
+                cards = cards_dict[list_key] if list_key else ()
+            else:
+                cards = cards_dict
+            
+            all_card_ids = {card['id'] for card in cards if isinstance(card, dict)}
+            unused_card_ids = all_card_ids.difference(self.card_usage[card_type].keys())
+            if unused_card_ids:
+                unused_cards[card_type] = list(unused_card_ids)
         
         return unused_cards
     
@@ -325,7 +355,7 @@ class GameAnalytics:
             'game_flow': {
                 'average_turns_per_player': self.total_turns / len(self.players_data) if self.players_data else 0,
                 'cell_visit_frequency': dict(self.cell_visits),
-                'turn_events_sample': self.turn_events[-10:] if len(self.turn_events) > 10 else self.turn_events
+                'turn_events_sample': list(self.turn_events)
             },
             'balance_insights': self._analyze_balance(),
             'warnings': dict(self.warnings) if self.warnings else {}
@@ -357,8 +387,8 @@ class GameAnalytics:
         # Resource flow analysis
         money_gains = self.mechanics_stats['money_transactions']['gains']
         money_losses = self.mechanics_stats['money_transactions']['losses']
-        if money_gains and money_losses:
-            insights['money_flow_balance'] = sum(money_gains) / sum(money_losses)
+        if money_gains['count'] and money_losses['count']:
+            insights['money_flow_balance'] = money_gains['total'] / money_losses['total']
         
         # Interaction frequency
         total_interactions = sum(self.mechanics_stats['interactions'].values())
@@ -389,8 +419,16 @@ class MultiGameAnalytics:
     """Analytics aggregator for multiple games"""
     
     def __init__(self):
-        self.games = []
+        # Reports are folded into the totals below as they arrive instead of being kept
+        self.games_count = 0
         self.aggregated_stats = defaultdict(list)
+        self.card_usage = defaultdict(lambda: defaultdict(int))  # {card_type: {card_id: uses}}
+        self.card_games = defaultdict(lambda: defaultdict(int))  # {card_type: {card_id: games used in}}
+        self.mechanics = defaultdict(lambda: defaultdict(int))
+        self.success_rate_totals = {
+            'document_exchange_success_rate': [0, 0],  # [sum of rates, games with a rate]
+            'dice_challenge_success_rate': [0, 0]
+        }
         self.victory_types = {}  # Will be populated with first game's config
         self.profile_victories = defaultdict(lambda: defaultdict(int))  # {profile_type: {victory_type: count}}
         self.warning_counts = defaultdict(int)  # Aggregate warning counts across all games
@@ -402,8 +440,11 @@ class MultiGameAnalytics:
 
     def add_game(self, game_analytics: GameAnalytics):
         """Add a completed game's analytics"""
-        report = game_analytics.generate_report()
-        self.games.append(report)
+        self.add_report(game_analytics.generate_report())
+
+    def add_report(self, report: Dict):
+        """Add a completed game's report from GameAnalytics.generate_report()"""
+        self.games_count += 1
         
         # Aggregate warnings from this game
         for warning, count in report.get('warnings', {}).items():
@@ -426,35 +467,38 @@ class MultiGameAnalytics:
                     profile_type = player_data['profile']
                     self.profile_victories[profile_type][victory_type] += 1
                     break
+        
+        # Aggregate card usage
+        for card_type, cards in report['card_usage_stats']['card_usage_distribution'].items():
+            for card_id, count in cards.items():
+                self.card_usage[card_type][card_id] += count
+                self.card_games[card_type][card_id] += 1
+        
+        # Aggregate mechanics
+        for mechanic_type, stats in report['mechanics_performance'].items():
+            if isinstance(stats, dict):
+                for stat_name, value in stats.items():
+                    if isinstance(value, (int, float)):
+                        self.mechanics[mechanic_type][stat_name] += value
+                    elif isinstance(value, dict) and 'count' in value:
+                        if stat_name not in self.mechanics[mechanic_type]:
+                            self.mechanics[mechanic_type][stat_name] = _new_flow_counter()
+                        _merge_flow_counters(self.mechanics[mechanic_type][stat_name], value)
+        
+        # Aggregate success rates
+        balance = report.get('balance_insights', {})
+        for rate_name, totals in self.success_rate_totals.items():
+            if rate_name in balance:
+                totals[0] += balance[rate_name]
+                totals[1] += 1
     
     def generate_summary_report(self) -> Dict:
         """Generate summary report across all games"""
-        if not self.games:
+        if not self.games_count:
             return {}
         
-        total_games = len(self.games)
-        
-        # Aggregate card usage across all games
-        all_card_usage = defaultdict(lambda: defaultdict(int))
-        all_mechanics = defaultdict(lambda: defaultdict(int))
-        
-        for game in self.games:
-            # Aggregate card usage
-            for card_type, cards in game['card_usage_stats']['card_usage_distribution'].items():
-                for card_id, count in cards.items():
-                    all_card_usage[card_type][card_id] += count
-            
-            # Aggregate mechanics
-            mechanics = game['mechanics_performance']
-            for mechanic_type, stats in mechanics.items():
-                if isinstance(stats, dict):
-                    for stat_name, value in stats.items():
-                        if isinstance(value, (int, float)):
-                            all_mechanics[mechanic_type][stat_name] += value
-                        elif isinstance(value, list):
-                            if stat_name not in all_mechanics[mechanic_type]:
-                                all_mechanics[mechanic_type][stat_name] = []
-                            all_mechanics[mechanic_type][stat_name].extend(value)
+        total_games = self.games_count
+        all_card_usage = self.card_usage
         
         return {
             'summary': {
@@ -470,7 +514,7 @@ class MultiGameAnalytics:
                 'most_used_cards_overall': self._get_top_cards(all_card_usage, 20),
                 'unused_cards': self._find_unused_cards(all_card_usage)
             },
-            'mechanics_summary': dict(all_mechanics),
+            'mechanics_summary': dict(self.mechanics),
             'balance_analysis': self._analyze_overall_balance()
         }
     
@@ -483,7 +527,7 @@ class MultiGameAnalytics:
                     'card_type': card_type,
                     'card_id': card_id,
                     'usage_count': count,
-                    'games_appeared': len([g for g in self.games if card_id in g['card_usage_stats']['card_usage_distribution'].get(card_type, {})])
+                    'games_appeared': self.card_games[card_type][card_id]
                 })
         
         all_cards.sort(key=lambda x: x['usage_count'], reverse=True)
@@ -497,32 +541,25 @@ class MultiGameAnalytics:
         for card_type, cards in card_usage.items():
             rarely_used[card_type] = [
                 card_id for card_id, count in cards.items() 
-                if count < len(self.games) * 0.1  # Used in less than 10% of games
+                if count < self.games_count * 0.1  # Used in less than 10% of games
             ]
         return rarely_used
     
     def _analyze_overall_balance(self) -> Dict:
         """Analyze overall game balance across all simulations"""
-        if not self.games:
+        if not self.games_count:
             return {}
         
         # Win rate analysis
-        winners = [g['game_metadata']['winner'] for g in self.games if g['game_metadata']['winner']]
+        winners = [winner for winner in self.aggregated_stats['winners'] if winner]
         win_distribution = Counter(winners)
         
         # Game length analysis
         turns = self.aggregated_stats['turns']
         
         # Success rates
-        doc_success_rates = []
-        challenge_success_rates = []
-        
-        for game in self.games:
-            balance = game.get('balance_insights', {})
-            if 'document_exchange_success_rate' in balance:
-                doc_success_rates.append(balance['document_exchange_success_rate'])
-            if 'dice_challenge_success_rate' in balance:
-                challenge_success_rates.append(balance['dice_challenge_success_rate'])
+        doc_rate_sum, doc_rate_games = self.success_rate_totals['document_exchange_success_rate']
+        challenge_rate_sum, challenge_rate_games = self.success_rate_totals['dice_challenge_success_rate']
         
         return {
             'game_length_stats': {
@@ -549,14 +586,14 @@ class MultiGameAnalytics:
                 'most_successful_profile': win_distribution.most_common(1)[0] if win_distribution else None
             },
             'success_rates': {
-                'avg_document_success_rate': sum(doc_success_rates) / len(doc_success_rates) if doc_success_rates else 0,
-                'avg_challenge_success_rate': sum(challenge_success_rates) / len(challenge_success_rates) if challenge_success_rates else 0
+                'avg_document_success_rate': doc_rate_sum / doc_rate_games if doc_rate_games else 0,
+                'avg_challenge_success_rate': challenge_rate_sum / challenge_rate_games if challenge_rate_games else 0
             },
             'warnings': {
                 'total_warnings': sum(self.warning_counts.values()),
                 'unique_warnings': len(self.warning_counts),
                 'warning_distribution': dict(self.warning_counts),
-                'avg_warnings_per_game': sum(self.warning_counts.values()) / len(self.games) if self.games else 0,
+                'avg_warnings_per_game': sum(self.warning_counts.values()) / self.games_count if self.games_count else 0,
                 'most_frequent_warnings': sorted(
                     [(warning, count) for warning, count in self.warning_counts.items()],
                     key=lambda x: (-x[1], x[0])  # Sort by count (descending) then by warning message
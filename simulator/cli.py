@@ -1,10 +1,11 @@
 import argparse
 import json
+import random
 from pathlib import Path
 
-from .utils import load_json_file, load_game_data
+from .loader import load_json_file, load_game_data
 from .stats import Statistics
-from .runner import run_game_simulation
+from .pool import run_games
 
 
 def main():
@@ -34,6 +35,12 @@ def main():
         action='store_true',
         help="Print progress and turn-by-turn output to console (also logs to file)."
     )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed for reproducible runs; game i uses seed + i.'
+    )
     args = parser.parse_args()
 
     # Setup logging: tee to file by default, or file-only when verbose is not set
@@ -42,9 +49,10 @@ def main():
     class _Tee:
         def __init__(self, *streams):
             self._streams = streams
+            self._writes = tuple(s.write for s in streams)
         def write(self, data):
-            for s in self._streams:
-                s.write(data)
+            for write in self._writes:
+                write(data)
             return len(data)
         def flush(self):
             for s in self._streams:
@@ -53,7 +61,8 @@ def main():
     # Ensure parent directory for output file exists if user overrides path
     Path(args.output).expanduser().resolve().parent.mkdir(parents=True, exist_ok=True)
 
-    log_fp = open(log_file_path, 'w', encoding='utf-8')
+    # A large buffer keeps the file-only path to a few bulk writes
+    log_fp = open(log_file_path, 'w', encoding='utf-8', buffering=1 << 16)
     original_stdout = sys.stdout
     if args.verbose:
         sys.stdout = _Tee(original_stdout, log_fp)
@@ -68,12 +77,14 @@ def main():
     game_data = load_game_data()
     stats = Statistics()
 
-    for i in range(args.runs):
-        if args.verbose and (i + 1) % (args.runs // 10 or 1) == 0:
-            pass
-
-        game_instance = run_game_simulation(config, game_data)
-        stats.record_game(game_instance)
+    # Games are independent, so they run across all cores. Seeds are chosen
+    # here so forked workers don't share one random stream
+    if args.seed is not None:
+        seeds = range(args.seed, args.seed + args.runs)
+    else:
+        seeds = [random.getrandbits(64) for _ in range(args.runs)]
+    for result in run_games(config, game_data, seeds, Statistics.summarize_game):
+        stats.record_result(result)
 
     # Restore stdout and close log file
     sys.stdout.flush()
@@ -24,27 +24,27 @@ class AI:
         # Priority 1: Critically low nerves
         if self.player.nerves <= 2:
             for item in self.player.personal_items_hand:
-                if (self._item_helps_nerves(item) and 
-                    self.player.can_use_personal_item(item) and
-                    self._can_use_item_now(item, turn_context)):
+                if (self._can_use_item_now(item, turn_context) and
+                    self._item_helps_nerves(item) and 
+                    self.player.can_use_personal_item(item)):
                     self.log(f"AI ({self.player.name}): Критически низкие нервы, использую '{item['name']}'")
                     return item
         
         # Priority 2: Goal advancement
         if self.player.win_condition:
             for item in self.player.personal_items_hand:
-                if (self._item_helps_goal(item) and 
-                    self.player.can_use_personal_item(item) and
-                    self._can_use_item_now(item, turn_context)):
+                if (self._can_use_item_now(item, turn_context) and
+                    self._item_helps_goal(item) and 
+                    self.player.can_use_personal_item(item)):
                     self.log(f"AI ({self.player.name}): Предмет поможет цели, использую '{item['name']}'")
                     return item
         
         # Priority 3: Defensive items when low on resources
         if self.player.money <= 3 or self.player.nerves <= 4:
             for item in self.player.personal_items_hand:
-                if (self._is_defensive_item(item) and 
-                    self.player.can_use_personal_item(item) and
-                    self._can_use_item_now(item, turn_context)):
+                if (self._can_use_item_now(item, turn_context) and
+                    self._is_defensive_item(item) and 
+                    self.player.can_use_personal_item(item)):
                     self.log(f"AI ({self.player.name}): Низкие ресурсы, использую защитный предмет '{item['name']}'")
                     return item
         
@@ -175,8 +175,9 @@ class AI:
         special_effects = item.get('special_effects', [])
         
         defensive_keywords = ['immunity', 'protection', 'shield', 'block', 'prevent']
+        special_text = str(special_effects).lower()
         for keyword in defensive_keywords:
-            if keyword in str(special_effects).lower():
+            if keyword in special_text:
                 return True
         
         return (effects.get('nerves', 0) >= 2 or 
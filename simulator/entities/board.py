@@ -2,8 +2,23 @@ import random
 
 class Board:
     """Represents the game board."""
-    def __init__(self, config):
+    def __init__(self, config, cell_template=None):
         self.size = config['game_parameters']['board_size']
+        if cell_template is None:
+            cell_template = Board.cell_template(config)
+
+        cells = list(cell_template)
+        random.shuffle(cells)
+        self.cells = cells[:self.size]
+
+    @staticmethod
+    def cell_template(config):
+        """Expand cell_frequencies into an unshuffled list of cell colors.
+
+        The result depends only on config, so callers building many boards can
+        compute it once and pass it to Board() as cell_template.
+        """
+        size = config['game_parameters']['board_size']
         cell_freq = config['game_parameters']['cell_frequencies']
 
         cells = []
@@ -11,12 +26,9 @@ class Board:
             cells.extend([color] * count)
 
         # Ensure the board is the correct size, filling with a default if necessary
-        while len(cells) < self.size:
+        while len(cells) < size:
             cells.append('white')  # Default to white for any unspecified cells
-
-        random.shuffle(cells)
-        self.cells = cells[:self.size]
+        return cells
 
     def get_cell_type(self, position):
         return self.cells[position % self.size]
-
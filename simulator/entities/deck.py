@@ -9,6 +9,9 @@ class Deck:
 
     def shuffle(self):
         random.shuffle(self.cards)
+        # The top of the deck is the end of the list, so draw() is an O(1)
+        # pop(); reversing keeps the draw order a seeded game had with pop(0)
+        self.cards.reverse()
 
     def draw(self):
         if not self.cards:
@@ -19,7 +22,7 @@ class Deck:
             self.discard_pile = []
             self.shuffle()
             print("Reshuffled discard pile into deck.")
-        return self.cards.pop(0)
+        return self.cards.pop()
 
     def discard(self, card):
         self.discard_pile.append(card)
@@ -49,6 +49,8 @@ class Player:
         self.is_eliminated = False
         self.eliminated_on_turn = None
         self.ai = AI(self, config)
+        # Optional hook(player, card) -> bool; returning True means it took the card
+        self.action_card_handler = None
         
         # Temporary bonuses and immunities system
         self.temporary_bonuses = {
@@ -87,6 +89,8 @@ class Player:
 
     def add_action_card(self, card):
         """Add an action card to player's hand."""
+        if self.action_card_handler is not None and self.action_card_handler(self, card):
+            return
         if len(self.action_cards) < self.max_action_cards:
             self.action_cards.append(card)
             self.log(f"{self.name} received action card: {card['name']}.")
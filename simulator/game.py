@@ -1,10 +1,12 @@
 """Main game class that orchestrates all game components."""
 
+import json
 import random
 from simulator.entities.board import Board
 from simulator.entities.deck import Deck
 from simulator.entities.player import Player
 from simulator.entities.ai import AI
+from simulator.loader import resolve_path
 
 from simulator.managers.event_manager import InteractiveEvent
 from simulator.managers.interaction_manager import InteractionManager
@@ -22,10 +24,34 @@ from simulator.analytics import GameAnalytics
 
 class Game:
     """Orchestrates a single game simulation."""
-    def __init__(self, config, game_data):
+    def __init__(self, config, game_data, seed=None):
         self.config = config
         self.game_data = game_data
-        self.board = Board(config)
+        # Character profiles don't change between games, so read them once
+        with open(resolve_path(self.config['character_profiles'])) as f:
+            self.character_profiles = json.load(f)['character_profiles']
+        # Goals to draw from when a player reaches document level 5
+        self.win_conditions = list(self.config['win_conditions'].items())
+        # Board layout and deck contents are the same for every game on this
+        # instance; reset() only copies and reshuffles them
+        self._board_cells = Board.cell_template(self.config)
+        self._deck_cards = self._collect_deck_cards()
+        self.quiet = self.config['quiet_mode']
+        self.logger = Logger(silent_mode=self.quiet)
+        self.analytics = GameAnalytics()
+        self.effect_manager = EffectManager(self.analytics, self.logger)
+        self.challenge_manager = ChallengeManager(self.effect_manager)
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Prepare a fresh game on this instance: new board, decks and players.
+
+        If seed is given, the global random generator is reseeded first so the
+        game is reproducible.
+        """
+        if seed is not None:
+            random.seed(seed)
+        self.board = Board(self.config, self._board_cells)
         self.setup_decks()
         self.setup_players()
         self.turn = 0
@@ -33,36 +59,38 @@ class Game:
         self.winner = None
         self.end_reason = None
 
-        # Initialize managers
-        self.logger = Logger(silent_mode=self.config['quiet_mode'])
+        # Managers that track the player list
         self.interaction_manager = InteractionManager(self.players)
         self.trade_manager = TradeManager(self.players, self.logger)
-        self.elimination_manager = EliminationManager(game_data, self.logger, self.players)
+        self.elimination_manager = EliminationManager(self.game_data, self.logger, self.players)
         
         # Initialize analytics
-        self.analytics = GameAnalytics()
+        self.analytics.reset()
         self.analytics.start_game(self.players)
-        self.effect_manager = EffectManager(self.analytics, self.logger)
-        self.challenge_manager = ChallengeManager(self.effect_manager)
 
-    def setup_decks(self):
-        """Initialize all card decks."""
-        self.decks = {
-            'action': Deck(self.game_data['action_cards']['action_cards']),
-            'green': Deck(self.game_data['green_cards']['green_cards']),
-            'red': Deck(self.game_data['health_cards']['health_cards'] + self.game_data['housing_cards']['housing_cards']),
-            'white': Deck(self.game_data['white_cards']['random_events']) if 'white_cards' in self.game_data else Deck([]),
+    def _collect_deck_cards(self):
+        """Gather the card list for every deck from game_data."""
+        deck_cards = {
+            'action': self.game_data['action_cards']['action_cards'],
+            'green': self.game_data['green_cards']['green_cards'],
+            'red': self.game_data['health_cards']['health_cards'] + self.game_data['housing_cards']['housing_cards'],
+            'white': self.game_data['white_cards']['random_events'] if 'white_cards' in self.game_data else [],
         }
-        
+
         # Add items deck if available
         if 'personal_items' in self.game_data:
             all_items = self.game_data['personal_items']['personal_items'].copy()
             if 'steal_effect_cards' in self.game_data['personal_items']:
                 all_items.extend(self.game_data['personal_items']['steal_effect_cards'])
-            self.decks['item'] = Deck(all_items)
+            deck_cards['item'] = all_items
+        return deck_cards
+
+    def setup_decks(self):
+        """Initialize all card decks."""
+        self.decks = {name: Deck(cards) for name, cards in self._deck_cards.items()}
 
     def log(self, message):
-        if not self.config['quiet_mode']:
+        if not self.quiet:
             print(message)
 
 
@@ -71,11 +99,7 @@ class Game:
         self.players = []
         num_players = self.config['game_parameters']['number_of_players']
         
-        # Load character profiles from character_config.json
-        with open(self.config['character_profiles']) as f:
-            import json
-            character_config = json.load(f)
-            profiles = random.sample(character_config['character_profiles'], num_players)
+        profiles = random.sample(self.character_profiles, num_players)
 
         for profile in profiles:
             # Players start without a goal - will choose at document level 5
@@ -90,40 +114,55 @@ class Game:
 
             self.players.append(player)
 
-    def run(self):
-        """Main game loop."""
+    def run(self, on_turn_end=None):
+        """Main game loop.
+
+        on_turn_end, if given, is called as on_turn_end(turn, players) after
+        every completed game turn.
+        """
         self.log(f"Starting game with {len(self.players)} players")
         while not self.game_over:
-            self.turn += 1
-            # Get active players
-            active_players = [p for p in self.players if not p.is_eliminated]
-            # Check for game over due to eliminations
-            game_over, winner = self.elimination_manager.check_game_over(self.players)
-            if game_over:
-                self.game_over = True
-                self.winner = winner
-                self.end_reason = 'elimination'
-                break
-            # Each player takes their turn
-            for player in active_players:
-                self.take_turn(player)
-                if self.game_over:
-                    break
-            # Check turn limit
-            max_turns = len(self.players) * 15  # 15 turns per player
-            if self.turn >= max_turns:
-                self.game_over = True
-                self.end_reason = 'time_limit'
-                self.winner = None
+            if self.step() and on_turn_end:
+                on_turn_end(self.turn, self.players)
         # End game analytics
         victory_type = self.winner.win_condition['key'] if self.winner and self.end_reason == 'win' else None
         self.analytics.end_game(self.winner, self.end_reason, victory_type)
         return self.winner
 
+    def step(self):
+        """Play one game turn (every active player moves once).
+
+        Returns False if the game ended by elimination before the turn was played.
+        """
+        self.turn += 1
+        # Get active players
+        active_players = [p for p in self.players if not p.is_eliminated]
+        # Check for game over due to eliminations
+        game_over, winner = self.elimination_manager.check_game_over(self.players)
+        if game_over:
+            self.game_over = True
+            self.winner = winner
+            self.end_reason = 'elimination'
+            return False
+        # Each player takes their turn
+        for player in active_players:
+            self.take_turn(player)
+            if self.game_over:
+                break
+        # Check turn limit
+        max_turns = len(self.players) * 15  # 15 turns per player
+        if self.turn >= max_turns:
+            self.game_over = True
+            self.end_reason = 'time_limit'
+            self.winner = None
+        return True
+
     def take_turn(self, player):
         """Handle a single player's turn."""
-        self.log(f"\n--- Game turn {self.turn}, Player: {player.name}, Player's turn: {player.turn_count} ---")
-        self.log(f"State before turn: {player}")
+        # Player state dumps are costly to format, so skip them entirely when quiet
+        if not self.quiet:
+            self.log(f"\n--- Game turn {self.turn}, Player: {player.name}, Player's turn: {player.turn_count} ---")
+            self.log(f"State before turn: {player}")
         
         player.turn_count += 1  # Increment player's turn count
 
@@ -154,7 +193,8 @@ class Game:
         if player.force_discard_excess_personal_items():
             self.log(f"📦 {player.name} now has {len(player.personal_items_hand)}/{player.max_personal_items_hand} personal items")
         
-        self.log(f"State after turn: {player}")
+        if not self.quiet:
+            self.log(f"State after turn: {player}")
         
         # Analytics: Track goal progress
         if player.win_condition:
@@ -355,8 +395,7 @@ class Game:
         """Check if player needs to select a goal."""
         if not player.goal_chosen and player.document_level >= 5:
             # Choose random goal
-            win_conditions = list(self.config['win_conditions'].items())
-            win_key, win_data = random.choice(win_conditions)
+            win_key, win_data = random.choice(self.win_conditions)
             player.win_condition = {"key": win_key, **win_data}
             player.goal_chosen = True
             
@@ -371,50 +410,42 @@ class Game:
             return
         
         goal = player.win_condition['requires']
-        met_all_conditions = True
         
+        # Bail out on the first unmet requirement
         for key, required_value in goal.items():
+            if key == 'housing_type':
+                if player.housing != required_value:
+                    return
+                continue
+            
             player_value = getattr(player, key, None)
+            if player_value is None:
+                return
             
             # Special handling for document_level
             if key == 'document_level':
                 player_value = int(player_value)
+            
+            try:
+                # Convert to appropriate type
+                if isinstance(required_value, (int, float)):
+                    player_value = float(player_value)
+                    required_value = float(required_value)
+                elif isinstance(required_value, str):
+                    player_value = str(player_value)
                 
-            if key == 'housing_type':
-                if player.housing != required_value:
-                    met_all_conditions = False
-                    break
-            elif player_value is None:
-                met_all_conditions = False
-                break
-            else:
-                try:
-                    if player_value is None:
-                        met_all_conditions = False
-                        break
-                    
-                    # Convert to appropriate type
-                    if isinstance(required_value, (int, float)):
-                        player_value = float(player_value)
-                        required_value = float(required_value)
-                    elif isinstance(required_value, str):
-                        player_value = str(player_value)
-                    
-                    if player_value < required_value:
-                        met_all_conditions = False
-                        break
-                except (ValueError, TypeError) as e:
-                    self.log(f"❌ ERROR in check_win_condition: {e}")
-                    self.log(f"   key = {key}, player_value = {player_value} (type: {type(player_value)})")
-                    self.log(f"   required_value = {required_value} (type: {type(required_value)})")
-                    met_all_conditions = False
-                    break
+                if player_value < required_value:
+                    return
+            except (ValueError, TypeError) as e:
+                self.log(f"❌ ERROR in check_win_condition: {e}")
+                self.log(f"   key = {key}, player_value = {player_value} (type: {type(player_value)})")
+                self.log(f"   required_value = {required_value} (type: {type(required_value)})")
+                return
         
-        if met_all_conditions:
-            self.game_over = True
-            self.winner = player
-            self.end_reason = 'win'
-            self.analytics.end_game(player, self.end_reason, player.win_condition['key'])
+        self.game_over = True
+        self.winner = player
+        self.end_reason = 'win'
+        self.analytics.end_game(player, self.end_reason, player.win_condition['key'])
 
     def handle_lap_completion(self, player):
         """Handle events that occur when a player completes a lap."""
@@ -445,7 +476,7 @@ class Game:
                 
     def calculate_win_progress(self, player) -> float:
         """Calculate how close a player is to winning (0.0 to 1.0)"""
-        if not hasattr(player, 'win_condition') or not player.win_condition:
+        if not player.win_condition:
             return 0.0
         
         goal = player.win_condition['requires']
@@ -1,4 +1,29 @@
 import json
+import os
+
+# Card data lives in the repository root; paths are resolved once at import
+# so loading works regardless of the current working directory
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_FILES = {
+    name: os.path.join(BASE_DIR, *parts)
+    for name, parts in {
+        'action_cards': ('actionCards', 'action_cards.json'),
+        'utility_items': ('itemCards', 'utility_items.json'),
+        'defensive_items': ('itemCards', 'defensive_items.json'),
+        'aggressive_items': ('itemCards', 'aggressive_items.json'),
+        'steal_effect_items': ('itemCards', 'steal_effect_items.json'),
+        'green_cards': ('greenCards', 'documents_work_cards.json'),
+        'health_cards': ('redCards', 'health_cards.json'),
+        'housing_cards': ('redCards', 'housing_cards.json'),
+        'random_events': ('whiteCards', 'random_events.json'),
+        'game_constants': ('Common', 'game_constants.json'),
+    }.items()
+}
+
+
+def resolve_path(path):
+    """Resolves a repository-relative path (as written in config.json) against BASE_DIR."""
+    return os.path.join(BASE_DIR, path)
 
 
 def load_json_file(filepath):
@@ -10,14 +35,14 @@ def load_json_file(filepath):
 def load_game_data():
     """Loads all necessary game data files."""
     data = {}
-    data['action_cards'] = load_json_file('actionCards/action_cards.json')
+    data['action_cards'] = load_json_file(DATA_FILES['action_cards'])
     
     # Загружаем колоды предметов из разных файлов
     try:
-        utility_items = load_json_file('itemCards/utility_items.json')
-        defensive_items = load_json_file('itemCards/defensive_items.json') 
-        aggressive_items = load_json_file('itemCards/aggressive_items.json')
-        steal_effect_items = load_json_file('itemCards/steal_effect_items.json')
+        utility_items = load_json_file(DATA_FILES['utility_items'])
+        defensive_items = load_json_file(DATA_FILES['defensive_items']) 
+        aggressive_items = load_json_file(DATA_FILES['aggressive_items'])
+        steal_effect_items = load_json_file(DATA_FILES['steal_effect_items'])
         
         # Объединяем все предметы
         all_items = []
@@ -37,12 +62,12 @@ def load_game_data():
         print(f"Warning: item files not found: {e}, skipping item deck")
         pass
 
-    data['green_cards'] = load_json_file('greenCards/documents_work_cards.json')
-    data['health_cards'] = load_json_file('redCards/health_cards.json')
-    data['housing_cards'] = load_json_file('redCards/housing_cards.json')
-    white_data = load_json_file('whiteCards/random_events.json')
+    data['green_cards'] = load_json_file(DATA_FILES['green_cards'])
+    data['health_cards'] = load_json_file(DATA_FILES['health_cards'])
+    data['housing_cards'] = load_json_file(DATA_FILES['housing_cards'])
+    white_data = load_json_file(DATA_FILES['random_events'])
     data['white_cards'] = {'random_events': white_data['random_events']}
-    data['game_constants'] = load_json_file('Common/game_constants.json')
+    data['game_constants'] = load_json_file(DATA_FILES['game_constants'])
     return data
 
 
@@ -1,6 +1,11 @@
 import random
 from simulator.mechanics.effects import EffectManager
 
+# id(challenge) -> (challenge, outcome key per roll). Card data is shared and
+# pickled, so the tables live here instead of on the challenge dicts; keeping
+# the challenge in the entry stops its id from being reused while cached.
+_OUTCOME_TABLES = {}
+
 class ChallengeManager:
     """Manages dice roll challenges and their outcomes."""
     
@@ -32,7 +37,7 @@ class ChallengeManager:
         logger(f"🎲 {player.name} rolls {roll} for {challenge.get('description', 'challenge')}")
 
         # Find the appropriate outcome based on roll
-        outcome_key = ChallengeManager._determine_outcome(roll, challenge['outcomes'])
+        outcome_key = ChallengeManager._outcome_table(challenge)[roll]
         chosen_outcome = challenge['outcomes'][outcome_key] 
         self.effect_manager.analytics.track_dice_challenge(player, challenge['skill_type'], card, roll, outcome_key)
         # Apply the outcome effects
@@ -42,6 +47,19 @@ class ChallengeManager:
             return True
         return False
 
+    @staticmethod
+    def _outcome_table(challenge):
+        """Map every die result to its outcome key, parsed once per challenge.
+
+        The table is indexed by roll (1-6) and cached in _OUTCOME_TABLES.
+        """
+        entry = _OUTCOME_TABLES.get(id(challenge))
+        if entry is None or entry[0] is not challenge:
+            outcomes = challenge['outcomes']
+            table = tuple(ChallengeManager._determine_outcome(roll, outcomes) for roll in range(7))
+            entry = _OUTCOME_TABLES[id(challenge)] = (challenge, table)
+        return entry[1]
+
     @staticmethod
     def _determine_outcome(roll, outcomes):
         """Determine which outcome applies based on the roll."""
@@ -0,0 +1,42 @@
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from simulator.game import Game
+
+# Game reused by every simulation a pool worker runs; set by _init_worker
+_worker_game = None
+
+
+def _init_worker(config, game_data):
+    """Build the Game this worker process reuses for all of its games."""
+    global _worker_game
+    _worker_game = Game(config, game_data)
+
+
+def _run_one_game(summarize, tracker, seed):
+    """Play one game on the worker's Game and return its summary."""
+    game = _worker_game
+    game.reset(seed)
+    if tracker is None:
+        game.run()
+        return summarize(game)
+    on_turn_end = tracker(game)
+    game.run(on_turn_end=on_turn_end)
+    return summarize(game, on_turn_end)
+
+
+def run_games(config, game_data, seeds, summarize, tracker=None):
+    """Play one game per seed across all cores and yield their summaries in seed order.
+
+    summarize(game) is called in the worker once a game has ended and must
+    return something picklable. If tracker is given, tracker(game) is called
+    after each reset; its result is passed to Game.run as on_turn_end and
+    then to summarize(game, on_turn_end). Both must be module-level callables
+    so they can be sent to the workers.
+    """
+    # A few chunks per core keeps workers busy without one pickle round-trip per game
+    chunksize = max(1, len(seeds) // ((os.cpu_count() or 1) * 4))
+    play = functools.partial(_run_one_game, summarize, tracker)
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(config, game_data)) as executor:
+        yield from executor.map(play, seeds, chunksize=chunksize)
@@ -1,4 +1,4 @@
-from .core import Game
+from .game import Game
 
 
 def run_game_simulation(config, game_data):
@@ -1,4 +1,5 @@
 import math
+from array import array
 
 class Statistics:
     """Collects and holds data from all simulation runs."""
@@ -11,45 +12,81 @@ class Statistics:
         self.eliminations_by_character = {}
         self.elimination_turns_by_character = {}
         self.goal_assignments = {}
-        self.final_states = []
+        # character -> number of games played / won, and final money, nerves
+        # and document level per game as typed columns instead of row dicts
+        self.games_by_character = {}
+        self.wins_as_character = {}
+        self.final_resources = {}
         self.no_winner_due_to_time_limit = 0
 
     def record_game(self, game):
         """Records the final state of a completed game."""
-        self.games_played += 1
-        self.total_turns += game.turn
-        self.game_durations.append(game.turn)  # Store individual duration
+        self.record_result(Statistics.summarize_game(game))
+
+    @staticmethod
+    def summarize_game(game):
+        """Reduce a finished game to the plain data record_result() needs.
 
+        The result holds only ids and numbers, so it pickles cheaply when
+        games are played in worker processes.
+        """
         winner = game.winner
-        if winner and winner.win_condition:
-            self.wins_by_character[winner.id] = self.wins_by_character.get(winner.id, 0) + 1
-            self.wins_by_goal[winner.win_condition['key']] = self.wins_by_goal.get(winner.win_condition['key'], 0) + 1
-        elif getattr(game, 'end_reason', None) == 'time_limit':
+        return {
+            'turn': game.turn,
+            'end_reason': getattr(game, 'end_reason', None),
+            'winner_goal': winner.win_condition['key'] if winner and winner.win_condition else None,
+            'winner': winner.id if winner and winner.win_condition else None,
+            'players': [
+                (
+                    player.id,
+                    player.win_condition['key'] if player.win_condition else None,
+                    player.money,
+                    player.nerves,
+                    player.document_level,
+                    player.is_eliminated,
+                    player.eliminated_on_turn,
+                    player == winner,
+                )
+                for player in game.players
+            ],
+        }
+
+    def record_result(self, result):
+        """Records a game summarized by summarize_game()."""
+        self.games_played += 1
+        self.total_turns += result['turn']
+        self.game_durations.append(result['turn'])  # Store individual duration
+
+        winner_id = result['winner']
+        if winner_id is not None:
+            self.wins_by_character[winner_id] = self.wins_by_character.get(winner_id, 0) + 1
+            goal_key = result['winner_goal']
+            self.wins_by_goal[goal_key] = self.wins_by_goal.get(goal_key, 0) + 1
+        elif result['end_reason'] == 'time_limit':
             self.no_winner_due_to_time_limit += 1
 
-        for player in game.players:
+        for char_id, goal_key, money, nerves, doc_level, eliminated, eliminated_on_turn, was_winner in result['players']:
             # Record goal assignment for this player's character (only if goal was chosen)
-            if player.win_condition:
-                char_id = player.id
-                goal_key = player.win_condition['key']
+            if goal_key:
                 if char_id not in self.goal_assignments:
                     self.goal_assignments[char_id] = {}
                 self.goal_assignments[char_id][goal_key] = self.goal_assignments[char_id].get(goal_key, 0) + 1
 
-            self.final_states.append({
-                'character': player.id,
-                'money': player.money,
-                'nerves': player.nerves,
-                'doc_level': player.document_level,
-                'was_eliminated': player.is_eliminated,
-                'was_winner': player == winner
-            })
-            if player.is_eliminated:
-                self.eliminations_by_character[player.id] = self.eliminations_by_character.get(player.id, 0) + 1
-                if player.eliminated_on_turn is not None:
-                    turns = self.elimination_turns_by_character.get(player.id, [])
-                    turns.append(player.eliminated_on_turn)
-                    self.elimination_turns_by_character[player.id] = turns
+            self.games_by_character[char_id] = self.games_by_character.get(char_id, 0) + 1
+            if was_winner:
+                self.wins_as_character[char_id] = self.wins_as_character.get(char_id, 0) + 1
+            columns = self.final_resources.get(char_id)
+            if columns is None:
+                columns = self.final_resources[char_id] = (array('d'), array('d'), array('d'))
+            columns[0].append(money)
+            columns[1].append(nerves)
+            columns[2].append(doc_level)
+            if eliminated:
+                self.eliminations_by_character[char_id] = self.eliminations_by_character.get(char_id, 0) + 1
+                if eliminated_on_turn is not None:
+                    turns = self.elimination_turns_by_character.get(char_id, [])
+                    turns.append(eliminated_on_turn)
+                    self.elimination_turns_by_character[char_id] = turns
 
     def _calculate_statistics(self, values):
         """Calculate mean, std dev, and 95% confidence interval for a list of values."""
@@ -97,10 +134,8 @@ class Statistics:
     
     def _calculate_win_rate_statistics(self, character_id):
         """Calculate win rate statistics for a character."""
-        # Find all games this character played
-        character_games = [state for state in self.final_states if state['character'] == character_id]
-        total_games = len(character_games)
-        wins = sum(1 for state in character_games if state['was_winner'])
+        total_games = self.games_by_character.get(character_id, 0)
+        wins = self.wins_as_character.get(character_id, 0)
         
         if total_games == 0:
             return {
@@ -152,7 +187,7 @@ class Statistics:
             }
         
         # Calculate win rate statistics for each character
-        all_characters = set(state['character'] for state in self.final_states)
+        all_characters = self.games_by_character
         win_rate_stats = {}
         for character_id in all_characters:
             win_rate_stats[character_id] = self._calculate_win_rate_statistics(character_id)
@@ -160,11 +195,7 @@ class Statistics:
         # Calculate final resource statistics by character
         resource_stats = {}
         for character_id in all_characters:
-            character_states = [state for state in self.final_states if state['character'] == character_id]
-            
-            money_values = [state['money'] for state in character_states]
-            nerves_values = [state['nerves'] for state in character_states]
-            doc_level_values = [state['doc_level'] for state in character_states]
+            money_values, nerves_values, doc_level_values = self.final_resources[character_id]
             
             resource_stats[character_id] = {
                 'final_money': self._calculate_statistics(money_values),
@@ -95,23 +95,23 @@ def test_all_combinations(config, target_group_size=6, runs_per_test=8):
     results = {}
     character_profiles = config['character_profiles']
     character_ids = [p['id'] for p in character_profiles]
+    profiles_by_id = {p['id']: p for p in character_profiles}
     
     print(f"\n🎯 Testing ALL possible combinations of {target_group_size} players from {len(character_ids)} characters...")
     
-    # Generate all possible combinations
-    all_combos = list(combinations(character_ids, target_group_size))
-    total_combos = len(all_combos)
+    # Iterate combinations lazily; only the count is needed up front
+    total_combos = math.comb(len(character_ids), target_group_size)
     
     print(f"📊 Total combinations to test: {total_combos}")
     print(f"📊 Estimated time: ~{total_combos * runs_per_test * 0.1:.1f}s")
     
     original_profiles = config['character_profiles'].copy()
     
-    for i, combo_ids in enumerate(all_combos, 1):
+    for i, combo_ids in enumerate(combinations(character_ids, target_group_size), 1):
         print(f"\n📊 Testing combination {i}/{total_combos}: {', '.join(combo_ids)}")
         
         # Filter to only selected characters
-        selected_profiles = [p for p in character_profiles if p['id'] in combo_ids]
+        selected_profiles = [profiles_by_id[char_id] for char_id in combo_ids]
         config['character_profiles'] = selected_profiles
         config['game_parameters']['number_of_players'] = target_group_size
         save_config(config)
@@ -262,8 +262,9 @@ def save_comprehensive_results(all_results):
         'results': all_results
     }
     
+    # Machine-read archive of every sub-run: write it compact and in one call
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(comprehensive_data, f, indent=2, ensure_ascii=False)
+        f.write(json.dumps(comprehensive_data, separators=(',', ':'), ensure_ascii=False))
     
     print(f"\n💾 Comprehensive results saved to: {output_path}")
 
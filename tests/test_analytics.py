@@ -0,0 +1,148 @@
+"""Tests for multi-game analytics aggregation."""
+
+import os
+import unittest
+from collections import Counter, defaultdict
+from types import SimpleNamespace
+from simulator.analytics import GameAnalytics, MultiGameAnalytics
+from simulator.game import Game
+from simulator.loader import BASE_DIR, load_game_data, load_json_file
+
+
+def _merged_flow(counters):
+    """Combine {'count', 'total', 'min', 'max'} counters by recomputing from all of them."""
+    counters = [c for c in counters if c['count']]
+    return {
+        'count': sum(c['count'] for c in counters),
+        'total': sum(c['total'] for c in counters),
+        'min': min((c['min'] for c in counters), default=None),
+        'max': max((c['max'] for c in counters), default=None),
+    }
+
+
+class TestResourceFlowCounters(unittest.TestCase):
+    """Test cases for money and nerve flow counters."""
+
+    def test_counters_match_amount_lists(self):
+        player = SimpleNamespace(name='Player 1')
+        amounts_by_game = [
+            {'money': [5, -3, 12, 0, -7], 'nerves': [-1, 2, -4]},
+            {'money': [1, 1, -20], 'nerves': []},
+        ]
+        multi = MultiGameAnalytics()
+        flows = {'money': 'money_transactions', 'nerves': 'nerve_changes'}
+        all_amounts = {(flow, d): [] for flow in flows.values() for d in ('gains', 'losses')}
+        for amounts in amounts_by_game:
+            analytics = GameAnalytics()
+            for resource, values in amounts.items():
+                gains = [v for v in values if v > 0]
+                losses = [abs(v) for v in values if v <= 0]
+                for value in values:
+                    analytics.track_resource_change(player, resource, value, 'test')
+                stats = analytics.mechanics_stats[flows[resource]]
+                for direction, expected in (('gains', gains), ('losses', losses)):
+                    all_amounts[flows[resource], direction].extend(expected)
+                    self.assertEqual(stats[direction], {
+                        'count': len(expected),
+                        'total': sum(expected),
+                        'min': min(expected, default=None),
+                        'max': max(expected, default=None),
+                    })
+            multi.add_game(analytics)
+
+        mechanics = multi.generate_summary_report()['mechanics_summary']
+        for (flow, direction), expected in all_amounts.items():
+            with self.subTest(flow=flow, direction=direction):
+                self.assertEqual(mechanics[flow][direction]['count'], len(expected))
+                self.assertEqual(mechanics[flow][direction]['total'], sum(expected))
+                self.assertEqual(mechanics[flow][direction]['min'], min(expected, default=None))
+                self.assertEqual(mechanics[flow][direction]['max'], max(expected, default=None))
+
+    def test_money_flow_balance_uses_totals(self):
+        analytics = GameAnalytics()
+        player = SimpleNamespace(name='Player 1')
+        for value in (10, 6, -4):
+            analytics.track_resource_change(player, 'money', value, 'test')
+        self.assertEqual(analytics._analyze_balance()['money_flow_balance'], 16 / 4)
+
+
+class TestMultiGameAnalytics(unittest.TestCase):
+    """Test cases for MultiGameAnalytics folding reports into running aggregates."""
+
+    @classmethod
+    def setUpClass(cls):
+        config = load_json_file(os.path.join(BASE_DIR, 'simulator', 'config.json'))
+        game = Game(config, load_game_data())
+        cls.config = config
+        cls.reports = []
+        for seed in range(20):
+            game.reset(seed)
+            game.run()
+            cls.reports.append(game.analytics.generate_report())
+
+    def setUp(self):
+        self.analytics = MultiGameAnalytics()
+        self.analytics.initialize_victory_types(self.config)
+        for report in self.reports:
+            self.analytics.add_report(report)
+        self.summary = self.analytics.generate_summary_report()
+
+    def test_card_usage_matches_reports(self):
+        usage = defaultdict(Counter)
+        games_appeared = defaultdict(Counter)
+        for report in self.reports:
+            for card_type, cards in report['card_usage_stats']['card_usage_distribution'].items():
+                for card_id, count in cards.items():
+                    usage[card_type][card_id] += count
+                    games_appeared[card_type][card_id] += 1
+
+        card_summary = self.summary['card_usage_summary']
+        self.assertEqual(card_summary['total_cards_played'], sum(sum(c.values()) for c in usage.values()))
+        self.assertEqual(card_summary['cards_by_type'], {k: sum(v.values()) for k, v in usage.items()})
+        for entry in card_summary['most_used_cards_overall']:
+            self.assertEqual(entry['usage_count'], usage[entry['card_type']][entry['card_id']])
+            self.assertEqual(entry['games_appeared'], games_appeared[entry['card_type']][entry['card_id']])
+        self.assertEqual(card_summary['unused_cards'], {
+            card_type: [card_id for card_id, count in cards.items() if count < len(self.reports) * 0.1]
+            for card_type, cards in usage.items()
+        })
+
+    def test_mechanics_match_reports(self):
+        mechanics = self.summary['mechanics_summary']
+        self.assertEqual(mechanics['dice_challenges']['total'],
+                         sum(r['mechanics_performance']['dice_challenges']['total'] for r in self.reports))
+        self.assertEqual(mechanics['interactions']['blocks'],
+                         sum(r['mechanics_performance']['interactions']['blocks'] for r in self.reports))
+        for flow in ('money_transactions', 'nerve_changes'):
+            for direction in ('gains', 'losses'):
+                with self.subTest(flow=flow, direction=direction):
+                    expected = _merged_flow(r['mechanics_performance'][flow][direction] for r in self.reports)
+                    self.assertEqual(mechanics[flow][direction], expected)
+        self.assertGreater(mechanics['money_transactions']['gains']['count'], 0)
+
+    def test_balance_matches_reports(self):
+        balance = self.summary['balance_analysis']
+        turns = [r['game_metadata']['total_turns'] for r in self.reports]
+        winners = [r['game_metadata']['winner'] for r in self.reports if r['game_metadata']['winner']]
+        self.assertEqual(self.summary['summary']['total_games'], len(self.reports))
+        self.assertEqual(balance['game_length_stats']['median_turns'], sorted(turns)[len(turns) // 2])
+        self.assertEqual(balance['win_balance']['win_distribution'], dict(Counter(winners)))
+
+        for rate_name, key in (('document_exchange_success_rate', 'avg_document_success_rate'),
+                               ('dice_challenge_success_rate', 'avg_challenge_success_rate')):
+            with self.subTest(rate=rate_name):
+                rates = [r['balance_insights'][rate_name] for r in self.reports
+                         if rate_name in r['balance_insights']]
+                expected = sum(rates) / len(rates) if rates else 0
+                self.assertAlmostEqual(balance['success_rates'][key], expected)
+
+    def test_reports_are_not_retained(self):
+        self.assertFalse(hasattr(self.analytics, 'games'))
+        self.assertEqual(self.analytics.games_count, len(self.reports))
+
+    def test_empty_summary(self):
+        self.assertEqual(MultiGameAnalytics().generate_summary_report(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for Game lifecycle: reset, step and run."""
+
+import os
+import tempfile
+import unittest
+from simulator.game import Game
+from simulator.loader import BASE_DIR, load_game_data, load_json_file
+
+
+def _play(game):
+    """Run a game to the end and record every player's state after each turn."""
+    trace = []
+
+    def on_turn_end(turn, players):
+        trace.append((turn, [(p.profile, p.position, p.money, p.nerves,
+                              p.document_level, p.language_level, p.is_eliminated)
+                             for p in players]))
+
+    winner = game.run(on_turn_end=on_turn_end)
+    return trace, winner.profile if winner else None, game.end_reason, game.turn
+
+
+class TestGameLifecycle(unittest.TestCase):
+    """Test cases for Game.reset, Game.step and Game.run."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config = load_json_file(os.path.join(BASE_DIR, 'simulator', 'config.json'))
+        cls.game_data = load_game_data()
+
+    def test_reset_replays_seed_like_fresh_game(self):
+        fresh = _play(Game(self.config, self.game_data, seed=7))
+
+        reused = Game(self.config, self.game_data, seed=99)
+        _play(reused)
+        reused.reset(7)
+        replayed = _play(reused)
+
+        self.assertTrue(fresh[0])
+        self.assertEqual(replayed, fresh)
+
+    def test_reset_clears_game_state(self):
+        game = Game(self.config, self.game_data, seed=3)
+        _play(game)
+        game.reset(4)
+        self.assertEqual(game.turn, 0)
+        self.assertFalse(game.game_over)
+        self.assertIsNone(game.winner)
+        self.assertIsNone(game.end_reason)
+        self.assertFalse(any(p.is_eliminated for p in game.players))
+
+    def test_step_stops_on_elimination_game_over(self):
+        game = Game(self.config, self.game_data, seed=5)
+        for player in game.players[1:]:
+            player.is_eliminated = True
+
+        self.assertFalse(game.step())
+        self.assertTrue(game.game_over)
+        self.assertEqual(game.end_reason, 'elimination')
+        self.assertIs(game.winner, game.players[0])
+
+    def test_builds_outside_repository_root(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                game = Game(self.config, self.game_data, seed=1)
+            finally:
+                os.chdir(cwd)
+        self.assertTrue(game.character_profiles)
+
+    def test_step_plays_a_turn(self):
+        game = Game(self.config, self.game_data, seed=5)
+        self.assertTrue(game.step())
+        self.assertEqual(game.turn, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+"""Tests for the interactive game setup."""
+
+import unittest
+from interactive_game import InteractiveGame
+
+
+class TestInteractiveGame(unittest.TestCase):
+    """Test cases for InteractiveGame built on the simulator Game."""
+
+    def test_item_deck_survives_reset(self):
+        game = InteractiveGame()
+        self.assertIn('item', game.decks)
+
+        game.reset(2)
+        self.assertIn('item', game.decks)
+        self.assertIsNotNone(game.decks['item'].draw())
+
+    def test_cards_are_annotated(self):
+        game = InteractiveGame()
+        card = game.decks['action'].draw()
+        self.assertIn('_is_global_event', card)
+        self.assertIn('_when', card)
+        self.assertIn('_cost_named', card)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Tests for running games in the shared process pool."""
+
+import os
+import unittest
+from simulator.game import Game
+from simulator.loader import BASE_DIR, load_game_data, load_json_file
+from simulator.pool import run_games
+from simulator.stats import Statistics
+
+
+class _TurnLog(list):
+    """Tracker that records the turn numbers a game reports"""
+
+    def __init__(self, game):
+        super().__init__()
+
+    def __call__(self, turn, players):
+        self.append(turn)
+
+
+def _turns_played(game, turn_log):
+    """Summary of how a game ended and the turns its tracker saw"""
+    return game.end_reason, list(turn_log)
+
+
+class TestRunGames(unittest.TestCase):
+    """Test cases for simulator.pool.run_games."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config = load_json_file(os.path.join(BASE_DIR, 'simulator', 'config.json'))
+        cls.game_data = load_game_data()
+
+    def test_summaries_match_in_process_games(self):
+        seeds = range(10, 16)
+        game = Game(self.config, self.game_data)
+        expected = []
+        for seed in seeds:
+            game.reset(seed)
+            game.run()
+            expected.append(Statistics.summarize_game(game))
+
+        pooled = run_games(self.config, self.game_data, seeds, Statistics.summarize_game)
+        self.assertEqual(list(pooled), expected)
+
+    def test_tracker_becomes_on_turn_end(self):
+        results = list(run_games(self.config, self.game_data, [3, 4], _turns_played, _TurnLog))
+        self.assertEqual(len(results), 2)
+        for end_reason, turns in results:
+            self.assertIn(end_reason, ('win', 'elimination', 'time_limit'))
+            self.assertEqual(turns, list(range(1, len(turns) + 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for Statistics aggregation."""
+
+import os
+import pickle
+import unittest
+from simulator.game import Game
+from simulator.loader import BASE_DIR, load_game_data, load_json_file
+from simulator.stats import Statistics
+
+
+class TestStatistics(unittest.TestCase):
+    """Test cases for the record_game and record_result paths."""
+
+    @classmethod
+    def setUpClass(cls):
+        config = load_json_file(os.path.join(BASE_DIR, 'simulator', 'config.json'))
+        cls.game = Game(config, load_game_data())
+
+    def test_record_result_matches_record_game(self):
+        direct = Statistics()
+        summarized = Statistics()
+        end_reasons = set()
+        for seed in range(30):
+            self.game.reset(seed)
+            self.game.run()
+            end_reasons.add(self.game.end_reason)
+            direct.record_game(self.game)
+            # Summaries cross process boundaries in the runners
+            result = pickle.loads(pickle.dumps(Statistics.summarize_game(self.game)))
+            summarized.record_result(result)
+
+        self.assertGreater(len(end_reasons), 1)
+        self.assertEqual(summarized.get_summary(), direct.get_summary())
+
+    def test_record_result_matches_game_state(self):
+        stats = Statistics()
+        games_by_character, wins_by_character, final_money = {}, {}, {}
+        eliminations, time_limits = {}, 0
+        for seed in range(30):
+            self.game.reset(seed)
+            self.game.run()
+            stats.record_result(Statistics.summarize_game(self.game))
+
+            winner = self.game.winner
+            if winner and winner.win_condition:
+                wins_by_character[winner.id] = wins_by_character.get(winner.id, 0) + 1
+            elif self.game.end_reason == 'time_limit':
+                time_limits += 1
+            for player in self.game.players:
+                games_by_character[player.id] = games_by_character.get(player.id, 0) + 1
+                final_money.setdefault(player.id, []).append(player.money)
+                if player.is_eliminated:
+                    eliminations[player.id] = eliminations.get(player.id, 0) + 1
+
+        summary = stats.get_summary()
+        self.assertEqual(summary['win_rate_by_character'], wins_by_character)
+        self.assertEqual(summary['no_winner_due_to_time_limit'], time_limits)
+        self.assertEqual({c: s['count'] for c, s in summary['elimination_rate_by_character'].items()},
+                         eliminations)
+        for char_id, games in games_by_character.items():
+            self.assertEqual(summary['win_rate_statistics'][char_id]['games_played'], games)
+            money = final_money[char_id]
+            self.assertEqual(summary['resource_statistics'][char_id]['final_money']['mean'],
+                             round(sum(money) / len(money), 2))
+
+    def test_summary_counts_games(self):
+        stats = Statistics()
+        for seed in range(3):
+            self.game.reset(seed)
+            self.game.run()
+            stats.record_result(Statistics.summarize_game(self.game))
+        summary = stats.get_summary()
+        self.assertEqual(summary['total_simulations'], 3)
+        self.assertEqual(sum(s['games_played'] for s in summary['win_rate_statistics'].values()),
+                         3 * len(self.game.players))
+
+
+if __name__ == '__main__':
+    unittest.main()